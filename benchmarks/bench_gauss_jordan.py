@@ -0,0 +1,102 @@
+# benchmarks/bench_gauss_jordan.py
+"""
+Compara el kernel de filas de proceso_gauss_jordan_detallado antes y después
+de la reescritura in-place (sin el texto de pasos, que no forma parte del kernel).
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.bench_gauss_jordan
+"""
+import random
+import time
+import tracemalloc
+from fractions import Fraction
+
+from core.proceso_gauss_jordan_detallado import _normalizar_fila, _eliminar_fila
+
+
+# =====================================================
+#   KERNELS A COMPARAR
+# =====================================================
+
+def _kernel_anterior(Aum, n):
+    """Versión original: cada paso crea una fila nueva de 2n fracciones."""
+    for col in range(n):
+        pivote_fila = next((f for f in range(col, n) if Aum[f][col] != 0), None)
+        if pivote_fila is None:
+            continue
+        if pivote_fila != col:
+            Aum[col], Aum[pivote_fila] = Aum[pivote_fila], Aum[col]
+        pivote = Aum[col][col]
+        if pivote != 1:
+            Aum[col] = [x / pivote for x in Aum[col]]
+        for r in range(n):
+            if r == col:
+                continue
+            factor = Aum[r][col]
+            if factor == 0:
+                continue
+            Aum[r] = [Aum[r][c] - factor * Aum[col][c] for c in range(2 * n)]
+
+
+def _kernel_actual(Aum, n):
+    """Versión in-place: solo columnas activas y sin listas nuevas."""
+    for col in range(n):
+        pivote_fila = next((f for f in range(col, n) if Aum[f][col] != 0), None)
+        if pivote_fila is None:
+            continue
+        if pivote_fila != col:
+            Aum[col], Aum[pivote_fila] = Aum[pivote_fila], Aum[col]
+        pivote = Aum[col][col]
+        if pivote != 1:
+            _normalizar_fila(Aum[col], pivote, col)
+        for r in range(n):
+            if r == col:
+                continue
+            factor = Aum[r][col]
+            if factor == 0:
+                continue
+            _eliminar_fila(Aum[r], Aum[col], factor, col)
+
+
+# =====================================================
+#   MEDICIÓN
+# =====================================================
+
+def _aumentada_aleatoria(n, semilla):
+    rnd = random.Random(semilla)
+    return [
+        [Fraction(rnd.randint(-9, 9)) for _ in range(n)] + [Fraction(int(i == j)) for j in range(n)]
+        for i in range(n)
+    ]
+
+
+def _medir(kernel, n, semilla=0):
+    # Tiempo sin trazar (tracemalloc ralentiza cada asignación)
+    Aum = _aumentada_aleatoria(n, semilla)
+    inicio = time.perf_counter()
+    kernel(Aum, n)
+    segundos = time.perf_counter() - inicio
+
+    # Memoria: pico asignado durante la eliminación
+    Aum_trazada = _aumentada_aleatoria(n, semilla)
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    kernel(Aum_trazada, n)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return segundos, pico - base, Aum
+
+
+def main(tamanos=(50, 100)):
+    print(f"{'n':>5} {'kernel':>10} {'tiempo (s)':>12} {'pico (KiB)':>12}")
+    for n in tamanos:
+        resultados = {}
+        for nombre, kernel in (("anterior", _kernel_anterior), ("in-place", _kernel_actual)):
+            seg, pico, Aum = _medir(kernel, n)
+            resultados[nombre] = Aum
+            print(f"{n:>5} {nombre:>10} {seg:>12.3f} {pico / 1024:>12.1f}")
+        assert resultados["anterior"] == resultados["in-place"], "Los kernels no coinciden"
+
+
+if __name__ == "__main__":
+    main()
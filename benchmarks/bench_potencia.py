@@ -0,0 +1,60 @@
+# benchmarks/bench_potencia.py
+"""
+Mide A^k con exponenciación binaria: primera llamada (calcula los cuadrados)
+frente a una segunda llamada con la misma A (los toma de la caché), y compara
+con el producto repetido k−1 veces. Comprueba además que modificar A después
+de una llamada no altera la caché.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.bench_potencia
+"""
+import random
+import time
+from fractions import Fraction
+
+from core.operaciones_matrices import potencia, multiplicar, _cache_potencias
+
+
+def _aleatoria(n, rnd):
+    return [[Fraction(rnd.randint(-3, 3), rnd.randint(1, 3)) for _ in range(n)] for _ in range(n)]
+
+
+def _tiempo(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def _producto_repetido(A, k):
+    R = A
+    for _ in range(k - 1):
+        R = multiplicar(R, A)
+    return R
+
+
+def _comprobar_copia_en_cache():
+    """Regresión: la caché guardaba la lista del llamador como A¹."""
+    _cache_potencias.clear()
+    A = [[1, 1], [1, 0]]
+    potencia(A, 3)
+    A[0][0] = 7
+    assert potencia([[1, 1], [1, 0]], 1) == [[1, 1], [1, 0]], "La caché cambió al modificar A"
+    assert potencia([[1, 1], [1, 0]], 5) == [[8, 5], [5, 3]], "La caché cambió al modificar A"
+
+
+def main(tamanos=(8, 16), k=64):
+    _comprobar_copia_en_cache()
+    rnd = random.Random(0)
+    print(f"{'n':>5} {'k':>5} {'repetido (s)':>13} {'binaria (s)':>12} {'en caché (s)':>13}")
+    for n in tamanos:
+        A = _aleatoria(n, rnd)
+        _cache_potencias.clear()
+        t_repetido, R1 = _tiempo(_producto_repetido, A, k)
+        t_binaria, R2 = _tiempo(potencia, A, k)
+        t_cache, R3 = _tiempo(potencia, A, k)
+        assert R1 == R2 == R3, "La potencia no coincide con el producto repetido"
+        print(f"{n:>5} {k:>5} {t_repetido:>13.3f} {t_binaria:>12.3f} {t_cache:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# benchmarks/bench_strassen.py
+"""
+Busca el punto de cruce entre el triple bucle y Strassen–Winograd para
+matrices exactas (Fraction) y enteras. Para cada n se mide el producto
+clásico y Strassen con un nivel de recursión (corte = n // 2), que es
+justo la decisión que toma CORTE_STRASSEN.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.bench_strassen
+"""
+import random
+import time
+from fractions import Fraction
+
+from core.strassen import multiplicar_strassen
+
+
+def _aleatoria(n, fracciones, rnd):
+    if fracciones:
+        return [[Fraction(rnd.randint(-50, 50), rnd.randint(1, 9)) for _ in range(n)] for _ in range(n)]
+    return [[rnd.randint(-50, 50) for _ in range(n)] for _ in range(n)]
+
+
+def _tiempo(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main(tamanos=(32, 64, 96, 128, 192)):
+    rnd = random.Random(0)
+    print(f"{'tipo':>9} {'n':>5} {'clásico (s)':>12} {'strassen (s)':>13} {'razón':>7}")
+    for fracciones in (True, False):
+        tipo = "Fraction" if fracciones else "int"
+        for n in tamanos:
+            A, B = _aleatoria(n, fracciones, rnd), _aleatoria(n, fracciones, rnd)
+            t_clasico, C1 = _tiempo(multiplicar_strassen, A, B, n)
+            t_strassen, C2 = _tiempo(multiplicar_strassen, A, B, n // 2)
+            assert C1 == C2, "Strassen no coincide con el producto clásico"
+            print(f"{tipo:>9} {n:>5} {t_clasico:>12.3f} {t_strassen:>13.3f} {t_clasico / t_strassen:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
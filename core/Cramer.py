@@ -52,6 +52,48 @@ def _matriz_con_columna_reemplazada(A: List[List[Any]], col_idx: int, b: List[An
 # Importa tu determinante por cofactores
 # ------------------------------------------------------------
 from core.determinante_matriz import determinante_cofactores
+from core.rango_modular import es_singular_probable, certificado_singularidad
+
+def _cramer_singular_certificado(A, b, certificado, pasos, rref) -> Dict[str, Any]:
+    """
+    A singular certificada: det(A) = 0 sin desarrollar cofactores, y el tipo de
+    solución se decide comparando rango(A) con rango([A|b]).
+    """
+    n = len(A)
+    rango_a = certificado["rango"]
+    rango_ab = certificado_singularidad([fila + [bi] for fila, bi in zip(A, b)])["rango"]
+
+    pasos.append("1) Pre-chequeo de singularidad:")
+    pasos.extend("  " + ln for ln in certificado["reporte"].splitlines())
+    pasos.append(f"Resultado: rango(A) = {rango_a} < {n} → det(A) = 0")
+    pasos.append("")
+    pasos.append(f"2) Rango de la matriz aumentada: rango([A|b]) = {rango_ab}")
+    pasos.append("")
+
+    if rango_ab > rango_a:
+        mensaje = (
+            f"det(A) = 0 y rango(A) = {rango_a} < rango([A|b]) = {rango_ab}. "
+            "El sistema es incompatible (no tiene solución)."
+        )
+        tipo = "sin_solucion"
+    else:
+        mensaje = (
+            f"det(A) = 0 y rango(A) = rango([A|b]) = {rango_a} < {n}. "
+            "El sistema es compatible indeterminado (infinitas soluciones). "
+            "Kramer no produce la parametrización."
+        )
+        tipo = "infinitas"
+
+    pasos.append("CONCLUSIÓN:")
+    pasos.append("  " + mensaje)
+    return {
+        "pasos": pasos,
+        "rref": rref,
+        "tipo_solucion": tipo,
+        "soluciones": None,
+        "mensaje_tipo": mensaje,
+        "solucion_parametrica": None,
+    }
 
 # ------------------------------------------------------------
 # Kramer desde matriz aumentada [A|b]
@@ -153,6 +195,12 @@ def resolver_sistema_Cramer_desde_aumentada(
     pasos.append(f"Variables: {', '.join(nombres)}")
     pasos.append("")
 
+    # -------- Pre-chequeo de singularidad (módulo primos de 61 bits) --------
+    if es_singular_probable(A):
+        certificado = certificado_singularidad(A)
+        if certificado["rango"] < n:
+            return _cramer_singular_certificado(A, b, certificado, pasos, rref)
+
     # -------- det(A) por cofactores --------
     detA_info = determinante_cofactores(A, expandir_por=expandir_por, indice=indice_expansion)
     detA = detA_info["det"]
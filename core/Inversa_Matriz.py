@@ -3,12 +3,253 @@ from fractions import Fraction
 from soporte.formato_matrices import formatear_matriz
 from core.operaciones_matrices import multiplicar_con_pasos
 from core.proceso_gauss_jordan_detallado import proceso_gauss_jordan_detallado
+from core.inversa_bloques import inversa_por_bloques, UMBRAL_BLOQUES
+from core.rango_modular import es_singular_probable, certificado_singularidad
+from core.backend_numerico import usa_flotante, inversa_flotante
+from core.enteros import a_enteros, inversa_bareiss, a_numeros, rango_bareiss
+from core.estructura import detectar_estructura, inversa_estructurada, bloques_diagonales, NOMBRES
 
-def inversa_matriz_con_reglas(M, modo="fraccion", tolerancia=1e-12):
+
+def _inversa_por_bloques_sin_pasos(M):
+    """Inversa por complemento de Schur: solo teoría y resultado, sin pasos intermedios."""
+    n = len(M)
+    inv = inversa_por_bloques(M)
+
+    texto_teorico = (
+        "MÉTODO: Inversa por bloques (complemento de Schur)\n"
+        "Se divide A en bloques A = [[P, Q], [R, S]] y se define S' = S − R·P⁻¹·Q.\n"
+        "Si P es invertible, A es invertible ⇔ S' lo es, y entonces\n"
+        "A⁻¹ = [[P⁻¹ + P⁻¹Q·S'⁻¹·R·P⁻¹, −P⁻¹Q·S'⁻¹], [−S'⁻¹·R·P⁻¹, S'⁻¹]]\n"
+        "Los bloques se invierten recursivamente con aritmética exacta.\n\n"
+        f"Matriz de {n}×{n}: procedimiento sin pasos intermedios."
+    )
+
+    if inv is None:
+        texto_resultado = "Conclusión: La matriz es singular (no tiene inversa)."
+        return {
+            "procedimiento": texto_teorico,
+            "resultado_frac": texto_resultado,
+            "resultado_lista": [],
+            "conclusiones": "La matriz es singular (no tiene inversa)."
+        }
+
+    texto_conclusion = "Conclusión: La matriz calculada es efectivamente A⁻¹ (no singular)."
+    return {
+        "procedimiento": texto_teorico,
+        "resultado_frac": formatear_matriz(inv) + "\n" + texto_conclusion,
+        "resultado_lista": inv,
+        "conclusiones": "La matriz calculada es efectivamente A⁻¹ (no singular)."
+    }
+
+
+def _inversa_enteros_sin_pasos(M, M_int):
+    """Inversa de una matriz entera grande por Gauss–Jordan libre de fracciones, sin pasos."""
+    n = len(M)
+    res = inversa_bareiss(M_int)
+
+    texto_teorico = (
+        "MÉTODO: Gauss–Jordan libre de fracciones (Bareiss) sobre [A | I]\n"
+        "Como A es entera, cada paso a_ij ← (a_kk·a_ij − a_ik·a_kj) / a_(k−1)(k−1) es una división exacta:\n"
+        "se trabaja solo con enteros y al final [A | I] se convierte en [det(A)·I | adj(A)].\n"
+        "A⁻¹ = adj(A) / det(A)  (una única división al final).\n\n"
+        f"Matriz de {n}×{n}: procedimiento sin pasos intermedios."
+    )
+
+    if res is None:
+        rango = rango_bareiss(M_int)
+        texto_resultado = "Conclusión: La matriz es singular (no tiene inversa)."
+        return {
+            "det": Fraction(0),
+            "rango": rango,
+            "justificacion_det": (
+                "MÉTODO: Determinante por eliminación libre de fracciones (reutilizada del cálculo de A⁻¹)\n"
+                f"Se encontró una columna sin pivote → rango(A) = {rango} < n.\n"
+                f"Una matriz con rango menor que su orden tiene det(A) = 0.\nrango(A) = {rango}"
+            ),
+            "procedimiento": texto_teorico,
+            "resultado_frac": texto_resultado,
+            "resultado_lista": [],
+            "conclusiones": "La matriz es singular (no tiene inversa)."
+        }
+
+    det, adj = res
+    inv = [[Fraction(x, det) for x in fila] for fila in adj]
+    texto_conclusion = "Conclusión: La matriz calculada es efectivamente A⁻¹ (no singular)."
+    return {
+        "det": Fraction(det),
+        "rango": n,
+        "justificacion_det": (
+            "MÉTODO: Determinante por eliminación libre de fracciones (reutilizada del cálculo de A⁻¹)\n"
+            f"El último pivote de Bareiss es det(A) = {det}\nrango(A) = {n}"
+        ),
+        "procedimiento": texto_teorico,
+        "resultado_frac": formatear_matriz(inv) + "\n" + texto_conclusion,
+        "resultado_lista": inv,
+        "conclusiones": "La matriz calculada es efectivamente A⁻¹ (no singular)."
+    }
+
+
+_TEXTO_ESTRUCTURA = {
+    "identidad": "I⁻¹ = I.",
+    "diagonal": "A⁻¹ = diag(1/a₁₁, …, 1/aₙₙ); det(A) = a₁₁·…·aₙₙ.",
+    "permutacion": "Para una permutación P⁻¹ = Pᵀ; det(P) = ±1 según la paridad de la permutación.",
+    "triangular_superior": "A⁻¹ por sustitución hacia atrás (A⁻¹ también es triangular superior); "
+                           "det(A) = producto de la diagonal.",
+    "triangular_inferior": "A⁻¹ por sustitución hacia adelante (A⁻¹ también es triangular inferior); "
+                           "det(A) = producto de la diagonal.",
+    "bloques_diagonal": "A⁻¹ = diag(A₁⁻¹, …, Aₖ⁻¹): cada bloque se invierte por separado.",
+}
+
+
+def _inversa_estructurada_sin_pasos(M, estructura):
+    """Inversa con el atajo correspondiente a la estructura detectada, sin pasos."""
+    n = len(M)
+    inv, det = inversa_estructurada(M, estructura)
+    texto_teorico = (
+        f"ATAJO: A es {NOMBRES[estructura]} (detectado en O(n²)).\n"
+        f"{_TEXTO_ESTRUCTURA[estructura]}"
+    )
+    if estructura == "bloques_diagonal":
+        tamanos = ", ".join(str(len(b)) for b in bloques_diagonales(M))
+        texto_teorico += f"\nTamaños de los bloques: {tamanos}"
+
+    if inv is None:
+        texto_resultado = "Conclusión: La matriz es singular (no tiene inversa)."
+        return {
+            "procedimiento": texto_teorico + "\nUn elemento diagonal (o un bloque) es singular.",
+            "resultado_frac": texto_resultado,
+            "resultado_lista": [],
+            "conclusiones": "La matriz es singular (no tiene inversa)."
+        }
+
+    texto_conclusion = "Conclusión: La matriz calculada es efectivamente A⁻¹ (no singular)."
+    resultado = {
+        "procedimiento": texto_teorico,
+        "resultado_frac": formatear_matriz(inv) + "\n" + texto_conclusion,
+        "resultado_lista": inv,
+        "conclusiones": "La matriz calculada es efectivamente A⁻¹ (no singular)."
+    }
+    if det is not None:
+        resultado.update({
+            "det": det,
+            "rango": n,
+            "justificacion_det": (
+                f"MÉTODO: Determinante de una matriz {NOMBRES[estructura]} (reutilizado del cálculo de A⁻¹)\n"
+                f"det(A) = {det}\nrango(A) = {n}"
+            ),
+        })
+    return resultado
+
+
+def _justificacion_determinante(info):
+    """Texto que justifica det(A) y rango(A) a partir de la eliminación ya realizada."""
+    pivotes = info["pivotes"]
+    k = info["permutaciones"]
+    texto = ["MÉTODO: Determinante a partir de la eliminación de Gauss–Jordan (reutilizada del cálculo de A⁻¹)"]
+    texto.append("Cada permutación de filas cambia el signo de det(A); dividir una fila por el pivote p divide det(A) entre p.")
+    texto.append("Al llegar a I (det(I) = 1): det(A) = (−1)^k · p₁ · p₂ · … · pₙ\n")
+    if pivotes:
+        texto.append("Pivotes usados: " + ", ".join(f"p{i+1} = {p}" for i, p in enumerate(pivotes)))
+    texto.append(f"Permutaciones de filas: k = {k}")
+    if info["det"] == 0:
+        texto.append(f"\nSe encontró al menos una columna sin pivote → rango(A) = {info['rango']} < n.")
+        texto.append("Una matriz con rango menor que su orden tiene det(A) = 0.")
+    else:
+        factores = "·".join(f"({p})" for p in pivotes)
+        texto.append(f"\ndet(A) = (−1)^{k} · {factores} = {info['det']}")
+    texto.append(f"rango(A) = {info['rango']}")
+    return "\n".join(texto)
+
+
+def _inversa_flotante_sin_pasos(M):
+    """Inversa en float64 con NumPy (backend flotante), sin pasos."""
+    inv = inversa_flotante(M)
+    texto_teorico = (
+        "MÉTODO: Inversa numérica en punto flotante (NumPy float64)\n"
+        f"Matriz de {len(M)}×{len(M)}: procedimiento sin pasos intermedios; "
+        "los resultados son aproximados."
+    )
+    if inv is None:
+        texto_resultado = "Conclusión: La matriz es numéricamente singular (no tiene inversa)."
+        return {
+            "procedimiento": texto_teorico,
+            "resultado_frac": texto_resultado,
+            "resultado_lista": [],
+            "conclusiones": texto_resultado
+        }
+    texto_conclusion = "Conclusión: Inversa aproximada calculada (no singular)."
+    # Formatear cientos de miles de floats costaría más que la propia inversa
+    if len(M) <= UMBRAL_BLOQUES:
+        texto_matriz = formatear_matriz(inv)
+    else:
+        texto_matriz = f"[Matriz de {len(M)}×{len(M)}: disponible en resultado_lista]"
+    return {
+        "procedimiento": texto_teorico,
+        "resultado_frac": texto_matriz + "\n" + texto_conclusion,
+        "resultado_lista": inv,
+        "conclusiones": texto_conclusion
+    }
+
+
+def _inversa_singular_certificada(M, certificado):
+    """Resultado para A singular a partir del certificado exacto (sin el proceso completo)."""
+    n = len(M)
+    rango = certificado["rango"]
+    texto_proceso = (
+        "Matriz A:\n"
+        f"{formatear_matriz(M)}\n\n"
+        f"{certificado['reporte']}\n\n"
+        "TEOREMA:\n"
+        "A es invertible ⇔ A·x = 0 solo tiene la solución trivial ⇔ rango(A) = n."
+    )
+    texto_resultado = (
+        "Conclusión: La matriz es singular (no tiene inversa), "
+        f"ya que su rango es menor que su orden (rango = {rango} < {n})."
+    )
+    return {
+        "det": Fraction(0),
+        "rango": rango,
+        "justificacion_det": (
+            f"{certificado['reporte']}\n\n"
+            f"Una matriz con rango menor que su orden tiene det(A) = 0.\nrango(A) = {rango}"
+        ),
+        "procedimiento": texto_proceso,
+        "resultado_frac": texto_resultado,
+        "resultado_lista": [],
+        "conclusiones": texto_resultado
+    }
+
+
+def _info_2x2(a, b, c, d, det):
+    """Subproductos det/rango de la fórmula 2×2."""
+    if det != 0:
+        rango = 2
+    else:
+        rango = 0 if all(x == 0 for x in (a, b, c, d)) else 1
+    return {
+        "det": det,
+        "rango": rango,
+        "justificacion_det": (
+            "MÉTODO: Determinante 2×2 (reutilizado del cálculo de A⁻¹)\n"
+            f"det(A) = ad − bc = ({a})({d}) − ({b})({c}) = {det}\n"
+            f"rango(A) = {rango}"
+        ),
+    }
+
+
+def inversa_matriz_con_reglas(M, modo="fraccion", tolerancia=1e-12, metodo="auto", backend=None):
     """
     Calcula la inversa de una matriz cuadrada.
     - Si es 2x2 → usa la fórmula directa.
     - Si es mayor → usa el método de Gauss–Jordan detallado con el formato oficial.
+    - metodo="bloques" (o "auto" con n > UMBRAL_BLOQUES) → inversa por complemento
+      de Schur, sin pasos; en "auto", si A es entera, Gauss–Jordan libre de fracciones.
+    - backend "flotante" (ver core.backend_numerico) → NumPy float64, sin pasos.
+    - metodo="estructura" (o "auto" con n > UMBRAL_BLOQUES) e identidad, diagonal,
+      permutación, triangular o diagonal por bloques (core.estructura) → atajo
+      específico, sin pasos; sin estructura especial se sigue como en "auto".
+    Salvo en el método por bloques o flotante, el resultado incluye también "det", "rango" y
+    "justificacion_det", obtenidos como subproductos de la eliminación.
     """
 
     # Validar matriz cuadrada
@@ -17,6 +258,25 @@ def inversa_matriz_con_reglas(M, modo="fraccion", tolerancia=1e-12):
 
     n = len(M)
 
+    if usa_flotante(backend):
+        return _inversa_flotante_sin_pasos(M)
+
+    # Como en el producto: el atajo solo se toma si los pasos no se iban a mostrar
+    if metodo == "estructura" or (metodo == "auto" and n > UMBRAL_BLOQUES):
+        A = a_numeros(M)
+        estructura = detectar_estructura(A)
+        if estructura is not None:
+            return _inversa_estructurada_sin_pasos(A, estructura)
+        metodo = "auto"
+
+    if metodo == "auto" and n > UMBRAL_BLOQUES:
+        M_int = a_enteros(M)
+        if M_int is not None:
+            return _inversa_enteros_sin_pasos(M, M_int)
+
+    if metodo == "bloques" or (metodo == "auto" and n > UMBRAL_BLOQUES):
+        return _inversa_por_bloques_sin_pasos(M)
+
     # =====================================================
     # CASO 2×2 — Fórmula directa
     # =====================================================
@@ -25,9 +285,12 @@ def inversa_matriz_con_reglas(M, modo="fraccion", tolerancia=1e-12):
         c, d = M[1]
         det = a * d - b * c
 
+        info = _info_2x2(a, b, c, d, det)
+
         # --- Caso sin inversa ---
         if det == 0:
             return {
+                **info,
                 "procedimiento": (
                     "DEFINICIÓN TEÓRICA:\n"
                     "Sea A una matriz cuadrada 2×2. Se dice que A es invertible si existe C tal que CA = I y AC = I.\n"
@@ -82,6 +345,7 @@ def inversa_matriz_con_reglas(M, modo="fraccion", tolerancia=1e-12):
         texto_resultado = formatear_matriz(inv) + "\n" + texto_conclusion
 
         return {
+            **info,
             "procedimiento": texto_teorico.strip(),
             "resultado_frac": texto_resultado.strip(),
             "resultado_lista": inv,
@@ -92,7 +356,19 @@ def inversa_matriz_con_reglas(M, modo="fraccion", tolerancia=1e-12):
     # CASO n > 2 — Gauss–Jordan (formato oficial)
     # =====================================================
     else:
-        texto_proceso, inv = proceso_gauss_jordan_detallado(M)
+        # Pre-chequeo módulo primos de 61 bits: si A parece singular se certifica
+        # exactamente y se evita generar todo el procedimiento.
+        if es_singular_probable(M):
+            certificado = certificado_singularidad(M)
+            if certificado["rango"] < n:
+                return _inversa_singular_certificada(M, certificado)
+
+        texto_proceso, inv, info = proceso_gauss_jordan_detallado(M)
+        subproductos = {
+            "det": info["det"],
+            "rango": info["rango"],
+            "justificacion_det": _justificacion_determinante(info),
+        }
 
         # --- Si la matriz no tiene inversa ---
         if inv is None:
@@ -102,6 +378,7 @@ def inversa_matriz_con_reglas(M, modo="fraccion", tolerancia=1e-12):
                 "lo que indica que su rango es menor que su orden (rango < n)."
             )
             return {
+                **subproductos,
                 "procedimiento": texto_proceso.strip(),
                 "resultado_frac": texto_resultado,
                 "resultado_lista": [],
@@ -119,6 +396,7 @@ def inversa_matriz_con_reglas(M, modo="fraccion", tolerancia=1e-12):
 
 
         return {
+            **subproductos,
             "procedimiento": texto_proceso.strip(),
             "resultado_frac": texto_resultado,
             "resultado_lista": inv,
@@ -0,0 +1,139 @@
+# core/backend_numerico.py
+"""
+Selector de backend numérico.
+- "exacto": aritmética racional con Fraction (comportamiento por defecto).
+- "flotante": rutinas vectorizadas de NumPy en float64, para trabajo exploratorio
+  con matrices grandes. Si NumPy no está instalado se usa siempre el exacto.
+"""
+from typing import List, Any, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+BACKEND_EXACTO = "exacto"
+BACKEND_FLOTANTE = "flotante"
+
+# Valores menores que esta tolerancia se consideran cero en modo flotante
+TOL_FLOTANTE = 1e-10
+
+_backend = BACKEND_EXACTO
+
+# =====================================================
+#   SELECCIÓN DE BACKEND
+# =====================================================
+
+def numpy_disponible() -> bool:
+    return np is not None
+
+
+def establecer_backend(nombre: str) -> str:
+    """Fija el backend global y devuelve el que queda activo."""
+    global _backend
+    if nombre not in (BACKEND_EXACTO, BACKEND_FLOTANTE):
+        raise ValueError(f"Backend desconocido: {nombre!r}")
+    _backend = nombre
+    return backend_activo()
+
+
+def backend_activo(backend: Optional[str] = None) -> str:
+    """Backend efectivo: el pedido (o el global) salvo que falte NumPy."""
+    elegido = backend or _backend
+    if elegido == BACKEND_FLOTANTE and np is None:
+        return BACKEND_EXACTO
+    return elegido
+
+
+def usa_flotante(backend: Optional[str] = None) -> bool:
+    return backend_activo(backend) == BACKEND_FLOTANTE
+
+
+# =====================================================
+#   OPERACIONES VECTORIZADAS (float64)
+# =====================================================
+
+def _a_array(M: List[List[Any]]):
+    return np.array([[float(x) for x in fila] for fila in M], dtype=np.float64)
+
+
+def sumar_flotante(A, B) -> List[List[float]]:
+    return (_a_array(A) + _a_array(B)).tolist()
+
+
+def restar_flotante(A, B) -> List[List[float]]:
+    return (_a_array(A) - _a_array(B)).tolist()
+
+
+def combinar_flotante(A, B, alfa=1.0, beta=1.0) -> List[List[float]]:
+    """α·A + β·B en una sola expresión vectorizada."""
+    return (float(alfa) * _a_array(A) + float(beta) * _a_array(B)).tolist()
+
+
+def multiplicar_flotante(A, B) -> List[List[float]]:
+    return (_a_array(A) @ _a_array(B)).tolist()
+
+
+def _inversa_array(M):
+    """Inversa como array; None si M es numéricamente singular."""
+    try:
+        inv = np.linalg.inv(M)
+    except np.linalg.LinAlgError:
+        return None
+    # Número de condición recíproco en norma 1 (barato una vez calculada la inversa)
+    rcond = 1.0 / (np.linalg.norm(M, 1) * np.linalg.norm(inv, 1))
+    if not np.isfinite(rcond) or rcond < TOL_FLOTANTE:
+        return None
+    return inv
+
+
+def inversa_flotante(A) -> Optional[List[List[float]]]:
+    """A⁻¹ en float64; None si A es numéricamente singular."""
+    inv = _inversa_array(_a_array(A))
+    return None if inv is None else inv.tolist()
+
+
+def solucion_unica_flotante(matriz_aumentada) -> Optional[List[float]]:
+    """
+    Atajo para [A|b] con A cuadrada y bien condicionada: x = A⁻¹·b.
+    Devuelve None si no aplica (A rectangular o casi singular) y hay que pasar a la RREF.
+    """
+    m = _a_array(matriz_aumentada)
+    if m.shape[1] - 1 != m.shape[0]:
+        return None
+    inv = _inversa_array(m[:, :-1])
+    if inv is None:
+        return None
+    return (inv @ m[:, -1]).tolist()
+
+
+def rref_flotante(matriz_aumentada) -> Tuple[List[List[float]], List[int]]:
+    """
+    RREF de [A|b] en float64 con pivoteo parcial; cada paso elimina toda la
+    columna con una sola operación vectorizada. Devuelve (rref, columnas_pivote),
+    con los valores menores que TOL_FLOTANTE puestos a 0.
+    """
+    m = _a_array(matriz_aumentada)
+    filas, columnas_a = m.shape[0], m.shape[1] - 1
+    fila_pivote = 0
+    columnas_pivote: List[int] = []
+
+    for col in range(columnas_a):
+        if fila_pivote == filas:
+            break
+        candidata = fila_pivote + int(np.argmax(np.abs(m[fila_pivote:, col])))
+        if abs(m[candidata, col]) < TOL_FLOTANTE:
+            m[fila_pivote:, col] = 0.0
+            continue
+        if candidata != fila_pivote:
+            m[[fila_pivote, candidata]] = m[[candidata, fila_pivote]]
+        m[fila_pivote] /= m[fila_pivote, col]
+        factores = m[:, col].copy()
+        factores[fila_pivote] = 0.0
+        # Solo las columnas activas: a la izquierda de col la fila pivote ya es cero
+        m[:, col:] -= np.outer(factores, m[fila_pivote, col:])
+        columnas_pivote.append(col)
+        fila_pivote += 1
+
+    m[np.abs(m) < TOL_FLOTANTE] = 0.0
+    return m.tolist(), columnas_pivote
@@ -0,0 +1,216 @@
+# core/base_incremental.py
+"""
+Base escalonada incremental para la independencia lineal.
+Se guarda una forma escalonada (exacta, en Fraction) de los vectores vistos
+hasta ahora y, para cada fila, su expresión como combinación de los vectores
+originales. Así, al agregar un vector:
+  - se reduce contra la base en O(r·d) (r = rango actual, d = dimensión);
+  - si se anula, es dependiente y los coeficientes salen de la reducción;
+  - si no, su resto se incorpora como nueva fila de la base.
+Quitar un vector dependiente no cambia la base; quitar uno que aportó una
+fila obliga a reconstruirla con los vectores restantes.
+Las consultas de pertenencia al generado (y sus coordenadas) reducen contra la
+misma base sin modificarla, también en O(r·d) por vector consultado.
+"""
+from collections import OrderedDict
+from fractions import Fraction
+from typing import List, Any, Dict, Optional
+from soporte.formato_matrices import convertir_a_fraccion
+
+
+# Conjuntos de vectores cuya base se conserva para consultas de generado
+MAX_CACHE_BASES = 16
+
+
+def _exacto(x) -> Fraction:
+    # Un float se toma por su representación decimal más corta (0.1 → 1/10)
+    if isinstance(x, float):
+        return Fraction(repr(x))
+    return convertir_a_fraccion(x)
+
+
+class BaseEscalonada:
+    def __init__(self):
+        self.vectores: List[List[Fraction]] = []
+        # Filas escalonadas con pivote 1, ordenadas por columna pivote
+        self._filas: List[List[Fraction]] = []
+        self._pivotes: List[int] = []
+        # _combinaciones[r][k] = coeficiente del vector k en la fila r
+        self._combinaciones: List[Dict[int, Fraction]] = []
+        # índice → True si el vector aportó una fila a la base
+        self._en_base: List[bool] = []
+
+    # ---------- consultas ----------
+    @property
+    def rango(self) -> int:
+        return len(self._filas)
+
+    @property
+    def independiente(self) -> bool:
+        return self.rango == len(self.vectores)
+
+    def __len__(self):
+        return len(self.vectores)
+
+    # ---------- reducción ----------
+    def _reducir(self, v):
+        """Resto de v contra la base y la combinación de vectores restada: v = resto + Σ cₖ·vₖ."""
+        resto = list(v)
+        combinacion: Dict[int, Fraction] = {}
+        for fila, p, comb in zip(self._filas, self._pivotes, self._combinaciones):
+            factor = resto[p]
+            if factor == 0:
+                continue
+            for c in range(p, len(resto)):
+                if fila[c] != 0:
+                    resto[c] -= factor * fila[c]
+            for k, a in comb.items():
+                combinacion[k] = combinacion.get(k, 0) + factor * a
+        return resto, combinacion
+
+    def agregar(self, v: List[Any]) -> Dict[str, Any]:
+        """
+        Inserta v y dice en el acto si depende de los anteriores.
+        Devuelve {"indice", "dependiente", "coeficientes"}; si es dependiente,
+        coeficientes = {k: cₖ} con v = Σ cₖ·vₖ (k = índices de vectores ya insertados).
+        """
+        v = [_exacto(x) for x in v]
+        indice = len(self.vectores)
+        self.vectores.append(v)
+        resto, combinacion = self._reducir(v)
+
+        p = next((c for c, x in enumerate(resto) if x != 0), None)
+        if p is None:
+            self._en_base.append(False)
+            coeficientes = {k: c for k, c in sorted(combinacion.items()) if c != 0}
+            return {"indice": indice, "dependiente": True, "coeficientes": coeficientes}
+
+        # resto = v − Σ cₖ·vₖ; se normaliza para que el pivote sea 1
+        piv = resto[p]
+        fila = [x / piv for x in resto]
+        comb = {k: -c / piv for k, c in combinacion.items() if c != 0}
+        comb[indice] = 1 / piv
+        pos = next((i for i, q in enumerate(self._pivotes) if q > p), len(self._pivotes))
+        self._filas.insert(pos, fila)
+        self._pivotes.insert(pos, p)
+        self._combinaciones.insert(pos, comb)
+        self._en_base.append(True)
+        return {"indice": indice, "dependiente": False, "coeficientes": None}
+
+    def quitar(self, indice: int) -> bool:
+        """
+        Elimina el vector 'indice' (los posteriores se renumeran).
+        Devuelve True si hubo que reconstruir la base.
+        """
+        en_base = self._en_base[indice]
+        restantes = self.vectores[:indice] + self.vectores[indice + 1:]
+        if indice == len(self.vectores) - 1:
+            # El último vector solo aparece en su propia fila (si la aportó)
+            self.vectores.pop()
+            self._en_base.pop()
+            if en_base:
+                r = next(r for r, comb in enumerate(self._combinaciones) if indice in comb)
+                del self._filas[r], self._pivotes[r], self._combinaciones[r]
+            return False
+        if not en_base:
+            # La base no cambia; solo se renumeran las combinaciones
+            self.vectores.pop(indice)
+            self._en_base.pop(indice)
+            self._combinaciones = [
+                {(k - 1 if k > indice else k): a for k, a in comb.items()} for comb in self._combinaciones
+            ]
+            return False
+        self.__init__()
+        for v in restantes:
+            self.agregar(v)
+        return True
+
+    def coordenadas(self, w: List[Any]) -> Optional[Dict[int, Fraction]]:
+        """
+        Coordenadas de w en términos de los vectores insertados ({k: cₖ}, w = Σ cₖ·vₖ),
+        o None si w no está en el generado. No modifica la base.
+        """
+        w = [_exacto(x) for x in w]
+        if self.vectores and len(w) != len(self.vectores[0]):
+            raise ValueError("El vector consultado no tiene la dimensión de los vectores del conjunto.")
+        resto, combinacion = self._reducir(w)
+        if any(x != 0 for x in resto):
+            return None
+        return {k: c for k, c in sorted(combinacion.items()) if c != 0}
+
+    def contiene(self, w: List[Any]) -> bool:
+        return self.coordenadas(w) is not None
+
+    def sincronizar(self, vectores: List[List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Ajusta la base a la lista 'vectores' reutilizando el prefijo común:
+        se quitan (desde el final) los vectores que cambiaron y se agregan los nuevos.
+        Devuelve los resultados de agregar de los vectores insertados.
+        """
+        nuevos = [[_exacto(x) for x in v] for v in vectores]
+        comun = 0
+        while comun < min(len(nuevos), len(self.vectores)) and nuevos[comun] == self.vectores[comun]:
+            comun += 1
+        for k in range(len(self.vectores) - 1, comun - 1, -1):
+            self.quitar(k)
+        return [self.agregar(v) for v in nuevos[comun:]]
+
+
+def texto_combinacion(indice: int, coeficientes: Dict[int, Fraction], nombre: Optional[str] = None) -> str:
+    """'v4 = 2·v1 − v3' a partir de los coeficientes de BaseEscalonada.agregar."""
+    nombre = nombre or f"v{indice + 1}"
+    if not coeficientes:
+        return f"{nombre} = 0"
+    partes = []
+    for k, c in coeficientes.items():
+        signo = "−" if c < 0 else "+"
+        mag = abs(c)
+        termino = f"v{k + 1}" if mag == 1 else f"{mag}·v{k + 1}"
+        partes.append((signo, termino))
+    texto = ("−" if partes[0][0] == "−" else "") + partes[0][1]
+    for signo, termino in partes[1:]:
+        texto += f" {signo} {termino}"
+    return f"{nombre} = {texto}"
+
+
+# =====================================================
+#   CONSULTAS DE GENERADO CON BASE EN CACHÉ
+# =====================================================
+_cache_bases: "OrderedDict[tuple, BaseEscalonada]" = OrderedDict()
+
+
+def base_para(vectores: List[List[Any]]) -> BaseEscalonada:
+    """BaseEscalonada de 'vectores', factorizada una sola vez y guardada en caché (LRU)."""
+    clave = tuple(tuple(_exacto(x) for x in v) for v in vectores)
+    base = _cache_bases.get(clave)
+    if base is None:
+        base = BaseEscalonada()
+        for v in clave:
+            base.agregar(v)
+        _cache_bases[clave] = base
+    _cache_bases.move_to_end(clave)
+    while len(_cache_bases) > MAX_CACHE_BASES:
+        _cache_bases.popitem(last=False)
+    return base
+
+
+def consultar_generado(vectores: List[List[Any]], consultas: List[List[Any]],
+                       base: Optional[BaseEscalonada] = None) -> List[Dict[str, Any]]:
+    """
+    ¿w ∈ gen(v₁, …, vₙ)? y sus coordenadas, para cada w de 'consultas' (en lote).
+    La factorización de los vectores se hace una vez; cada consulta cuesta O(r·d).
+    'base' (BaseEscalonada ya sincronizada con 'vectores') evita buscarla en la caché.
+    Cada resultado: {"pertenece", "coordenadas" ({k: cₖ} o None), "texto"}.
+    """
+    if base is None:
+        base = base_para(vectores)
+    resultados = []
+    for i, w in enumerate(consultas):
+        nombre = f"w{i + 1}" if len(consultas) > 1 else "w"
+        coords = base.coordenadas(w)
+        if coords is None:
+            texto = f"{nombre} ∉ gen(v1, …, v{len(vectores)}): el sistema es inconsistente."
+        else:
+            texto = f"{nombre} ∈ gen(v1, …, v{len(vectores)}): " + texto_combinacion(0, coords, nombre)
+        resultados.append({"pertenece": coords is not None, "coordenadas": coords, "texto": texto})
+    return resultados
@@ -0,0 +1,78 @@
+# core/cadena_matrices.py
+"""
+Parentización óptima de cadenas de productos y su modelo de costo
+(los usa core.expresiones_matriciales al reordenar cada cadena).
+"""
+import math
+from typing import List, Any, Tuple
+from soporte.formato_matrices import convertir_a_fraccion
+
+# Bits que caben en una palabra de máquina: por debajo, una multiplicación cuesta 1
+BITS_PALABRA = 64
+
+# =====================================================
+#   MODELO DE COSTO
+# =====================================================
+
+def bits_promedio(M: List[List[Any]]) -> float:
+    """Tamaño medio (en bits de numerador + denominador) de las entradas de M."""
+    total, cuenta = 0, 0
+    for fila in M:
+        for x in fila:
+            f = convertir_a_fraccion(x)
+            total += f.numerator.bit_length() + f.denominator.bit_length()
+            cuenta += 1
+    return max(1.0, total / max(1, cuenta))
+
+
+def _costo_escalar(bits_a: float, bits_b: float) -> float:
+    """Costo relativo de multiplicar dos entradas (multiplicación escolar por palabras)."""
+    return max(1.0, bits_a / BITS_PALABRA) * max(1.0, bits_b / BITS_PALABRA)
+
+
+def orden_optimo(dims: List[int], bits: List[float]) -> Tuple[float, List[List[int]]]:
+    """
+    Programación dinámica clásica O(k³) para la cadena M1·…·Mk, con Mi de dims[i-1]×dims[i].
+    El costo de cada producto p×q por q×r es p·q·r multiplicaciones, ponderadas por el
+    tamaño estimado de las entradas; el resultado tiene entradas de ≈ bits_a + bits_b + log2(q) bits.
+    Devuelve (costo mínimo, tabla de cortes).
+    """
+    k = len(dims) - 1
+    costo = [[0.0] * k for _ in range(k)]
+    bits_res = [[0.0] * k for _ in range(k)]
+    corte = [[0] * k for _ in range(k)]
+    for i in range(k):
+        bits_res[i][i] = bits[i]
+
+    for largo in range(2, k + 1):
+        for i in range(k - largo + 1):
+            j = i + largo - 1
+            costo[i][j] = math.inf
+            for s in range(i, j):
+                q = dims[s + 1]
+                c = (costo[i][s] + costo[s + 1][j]
+                     + dims[i] * q * dims[j + 1] * _costo_escalar(bits_res[i][s], bits_res[s + 1][j]))
+                if c < costo[i][j]:
+                    costo[i][j] = c
+                    corte[i][j] = s
+                    bits_res[i][j] = bits_res[i][s] + bits_res[s + 1][j] + math.log2(max(2, q))
+    return costo[0][k - 1], corte
+
+
+def costo_izquierda_a_derecha(dims: List[int], bits: List[float]) -> float:
+    """Costo del orden ((M1·M2)·M3)·… que sigue quien encadena de a pares."""
+    total, bits_acum = 0.0, bits[0]
+    for i in range(1, len(dims) - 1):
+        q = dims[i]
+        total += dims[0] * q * dims[i + 1] * _costo_escalar(bits_acum, bits[i])
+        bits_acum += bits[i] + math.log2(max(2, q))
+    return total
+
+
+def parentizar(corte, nombres, i, j) -> str:
+    if i == j:
+        return nombres[i]
+    s = corte[i][j]
+    izq = parentizar(corte, nombres, i, s)
+    der = parentizar(corte, nombres, s + 1, j)
+    return f"({izq}·{der})"
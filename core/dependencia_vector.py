@@ -1,38 +1,121 @@
+import math
+from fractions import Fraction
+
 TOL = 1e-9
 
+# Ancho relativo de las cubetas de candidatos a múltiplo con float (escala logarítmica).
+# Cubetas anchas solo cuestan más confirmaciones; la decisión la toma la tolerancia
+ANCHO_CUBETA = 1e-3
+
 def es_cero(x, tol=TOL):
+    if isinstance(x, (int, Fraction)):
+        return x == 0
     return abs(x) <= tol
 
 def es_vector_cero(v, tol=TOL):
     return all(es_cero(x, tol) for x in v)
 
-def son_multiplos(u, v, tol=TOL):
-    """True si existe k != 0 tal que u = k*v (y u,v no nulos)."""
-    if len(u) != len(v):
-        return False
-    if es_vector_cero(u, tol) or es_vector_cero(v, tol):
-        return False  # El caso del vector cero se maneja por otra regla
+def _cociente_si_multiplos(u, v, tol, tol_cociente):
+    """
+    k con v = k·u comparando componente a componente (misma regla que la comparación
+    par a par original): ceros en las mismas posiciones y cocientes v_c/u_c que difieren
+    del primero en a lo sumo tol_cociente. None si no son múltiplos.
+    """
     k = None
     for a, b in zip(u, v):
-        if es_cero(b, tol):
-            if not es_cero(a, tol):
-                return False
-            else:
-                continue
-        ratio = a / b
+        cero_a, cero_b = es_cero(a, tol), es_cero(b, tol)
+        if cero_a and cero_b:
+            continue
+        if cero_a or cero_b:
+            return None
+        cociente = b / a
         if k is None:
-            k = ratio
-        elif abs(ratio - k) > tol:
-            return False
-    return k is not None and not es_cero(k, tol)
+            k = cociente
+        elif abs(cociente - k) > tol_cociente:
+            return None
+    return k
+
+def direccion_canonica(v, tol=TOL, paso=None):
+    """
+    Clave de la dirección de v, con v dividido por su primera entrada no nula.
+    - paso=None: clave exacta en Fraction (entradas int/Fraction); dos vectores no
+      nulos son múltiplos ⇔ tienen la misma clave.
+    - paso (float): clave aproximada (posiciones no nulas y cubeta logarítmica de ancho
+      ANCHO_CUBETA del valor absoluto de la segunda componente no nula normalizada).
+      Solo propone candidatos: hay que revisar también las cubetas vecinas y confirmar
+      con la tolerancia 'paso'.
+    Devuelve (clave, primera_entrada_no_nula), o (None, None) si v es nulo.
+    """
+    if paso is None:
+        lider = next((x for x in v if not es_cero(x, tol)), None)
+        if lider is None:
+            return None, None
+        lider = Fraction(lider)
+        return tuple(Fraction(x) / lider for x in v), lider
+    patron = tuple(not es_cero(x, tol) for x in v)
+    no_nulas = [x for x, no_nula in zip(v, patron) if no_nula]
+    if not no_nulas:
+        return None, None
+    lider = no_nulas[0]
+    cubeta = 0
+    if len(no_nulas) > 1:
+        cubeta = round((math.log(abs(no_nulas[1])) - math.log(abs(lider))) / ANCHO_CUBETA)
+    return (patron, cubeta), lider
+
+
+def primer_par_multiplo(vectores, tol=TOL, paso=TOL):
+    """
+    Primer par (i, j), i < j, con v_j = k·v_i, agrupando por dirección canónica
+    en un dict: O(n·d) en vez de comparar todos los pares.
+    Devuelve (i, j, k) o None. Si todas las entradas son int/Fraction la clave es exacta;
+    con float, los vectores de la misma cubeta o de las vecinas se confirman con
+    cocientes que difieren en a lo sumo 'paso'.
+    """
+    exacto = all(isinstance(x, (int, Fraction)) for v in vectores for x in v)
+    if not exacto:
+        return _primer_par_aproximado(vectores, tol, paso)
+
+    grupos = {}
+    for idx, v in enumerate(vectores):
+        clave, lider = direccion_canonica(v, tol)
+        if clave is not None:
+            grupos.setdefault(clave, []).append((idx, lider))
+
+    # El par de menor (i, j) es el de los dos primeros miembros del grupo con menor i
+    mejor = None
+    for miembros in grupos.values():
+        if len(miembros) > 1 and (mejor is None or miembros[0][0] < mejor[0]):
+            (i, lider_i), (j, lider_j) = miembros[0], miembros[1]
+            mejor = (i, j, lider_j / lider_i)
+    return mejor
+
+
+def _primer_par_aproximado(vectores, tol, paso):
+    cubetas = {}
+    mejor = None
+    for j, v in enumerate(vectores):
+        clave, _ = direccion_canonica(v, tol, paso)
+        if clave is None:
+            continue
+        patron, cubeta = clave
+        for vecina in (cubeta - 1, cubeta, cubeta + 1):
+            for i in cubetas.get((patron, vecina), ()):
+                # Solo interesa un i menor que el del mejor par encontrado
+                if mejor is not None and i >= mejor[0]:
+                    break
+                k = _cociente_si_multiplos(vectores[i], v, tol, paso)
+                if k is not None:
+                    mejor = (i, j, k)
+                    break
+        cubetas.setdefault(clave, []).append(j)
+    return mejor
+
 
 def hay_multiplo_entre_pares(vectores, tol=TOL):
-    n = len(vectores)
-    for i in range(n):
-        for j in range(i+1, n):
-            if son_multiplos(vectores[i], vectores[j], tol):
-                return True, (i, j)
-    return False, None
+    par = primer_par_multiplo(vectores, tol, paso=tol)
+    if par is None:
+        return False, None
+    return True, par[:2]
 
 def mas_vectores_que_entradas(vectores):
     n = len(vectores)
@@ -1,6 +1,7 @@
 # determinante_cofactores_final.py
 from fractions import Fraction
 from typing import List, Any, Dict
+from core.enteros import a_enteros, det_bareiss
 
 # =====================================================
 #   FUNCIONES AUXILIARES
@@ -73,6 +74,8 @@ def determinante_cofactores(A_raw: List[List[Any]], expandir_por="fila", indice=
     """
     A = to_square(A_raw)
     n = len(A)
+    # Si A es entera, los menores se calculan con Bareiss sobre int
+    A_int = a_enteros(A)
     por_fila = expandir_por.lower().startswith("fila")
     idx = max(0, min(indice, n-1))
 
@@ -111,7 +114,7 @@ def determinante_cofactores(A_raw: List[List[Any]], expandir_por="fila", indice=
             continue
         s = sgn(i,j)
         Mij = minor(A,i,j)
-        detM = det_rec(Mij)
+        detM = F(det_bareiss(minor(A_int,i,j))) if A_int is not None else det_rec(Mij)
         term = s * aij * detM
         contribs.append(term)
         reporte.append(f"Término a_{{{i+1},{j+1}}}:")
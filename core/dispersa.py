@@ -0,0 +1,166 @@
+# core/dispersa.py
+"""
+Matrices dispersas en formato CSR (compressed sparse row) con valores exactos.
+Solo se guardan las entradas distintas de cero (Fraction o int):
+    valores[k], columnas[k]  para k en inicio[i] … inicio[i+1]-1  → fila i
+Los kernels recorren únicamente esas entradas. La conversión desde/hacia la
+lista de listas de la interfaz es explícita: MatrizCSR.desde_lista / a_lista.
+"""
+from fractions import Fraction
+from typing import List, Any, Tuple
+
+# Por debajo de esta fracción de entradas no nulas conviene el producto disperso
+DENSIDAD_DISPERSA = 0.1
+
+# En matrices más pequeñas el bucle denso (que ya salta ceros) es suficiente
+ORDEN_MIN_DISPERSA = 32
+
+
+class MatrizCSR:
+    __slots__ = ("filas", "cols", "valores", "columnas", "inicio")
+
+    def __init__(self, filas: int, cols: int, valores: List[Any], columnas: List[int], inicio: List[int]):
+        self.filas = filas
+        self.cols = cols
+        self.valores = valores
+        self.columnas = columnas
+        self.inicio = inicio
+
+    # ---------- conversiones ----------
+    @classmethod
+    def desde_lista(cls, M: List[List[Any]]) -> "MatrizCSR":
+        valores, columnas, inicio = [], [], [0]
+        for fila in M:
+            for j, x in enumerate(fila):
+                if x != 0:
+                    valores.append(x)
+                    columnas.append(j)
+            inicio.append(len(valores))
+        return cls(len(M), len(M[0]) if M else 0, valores, columnas, inicio)
+
+    def a_lista(self, cero=0) -> List[List[Any]]:
+        M = []
+        for i in range(self.filas):
+            fila = [cero] * self.cols
+            for k in range(self.inicio[i], self.inicio[i + 1]):
+                fila[self.columnas[k]] = self.valores[k]
+            M.append(fila)
+        return M
+
+    # ---------- consultas ----------
+    @property
+    def forma(self) -> Tuple[int, int]:
+        return self.filas, self.cols
+
+    @property
+    def no_nulos(self) -> int:
+        return len(self.valores)
+
+    def fila(self, i):
+        """Pares (columna, valor) de la fila i."""
+        a, b = self.inicio[i], self.inicio[i + 1]
+        return zip(self.columnas[a:b], self.valores[a:b])
+
+    def __repr__(self):
+        return f"MatrizCSR({self.filas}×{self.cols}, no nulos={self.no_nulos})"
+
+
+# =====================================================
+#   DETECCIÓN
+# =====================================================
+
+def densidad(M: List[List[Any]]) -> float:
+    """Fracción de entradas no nulas de una lista de listas."""
+    total = len(M) * len(M[0]) if M and M[0] else 0
+    if total == 0:
+        return 0.0
+    return sum(1 for fila in M for x in fila if x != 0) / total
+
+
+def conviene_dispersa(*matrices) -> bool:
+    return all(densidad(M) <= DENSIDAD_DISPERSA for M in matrices)
+
+
+# =====================================================
+#   KERNELS
+# =====================================================
+
+def _desde_filas(filas_dict: List[dict], cols: int) -> MatrizCSR:
+    """Construye la CSR a partir de un dict {columna: valor} por fila, descartando ceros."""
+    valores, columnas, inicio = [], [], [0]
+    for acumulado in filas_dict:
+        for j in sorted(acumulado):
+            x = acumulado[j]
+            if x != 0:
+                valores.append(x)
+                columnas.append(j)
+        inicio.append(len(valores))
+    return MatrizCSR(len(filas_dict), cols, valores, columnas, inicio)
+
+
+def multiplicar_dispersas(A: MatrizCSR, B: MatrizCSR) -> MatrizCSR:
+    """
+    A·B con ambas dispersas (algoritmo de Gustavson): cada entrada a_ik no nula
+    se combina solo con las entradas no nulas de la fila k de B.
+    """
+    if A.cols != B.filas:
+        raise ValueError("Para multiplicar: columnas de A deben coincidir con filas de B.")
+    B_val, B_col, B_ini = B.valores, B.columnas, B.inicio
+    filas = []
+    for i in range(A.filas):
+        acumulado = {}
+        for k_a in range(A.inicio[i], A.inicio[i + 1]):
+            a, k = A.valores[k_a], A.columnas[k_a]
+            for k_b in range(B_ini[k], B_ini[k + 1]):
+                j = B_col[k_b]
+                acumulado[j] = acumulado.get(j, 0) + a * B_val[k_b]
+        filas.append(acumulado)
+    return _desde_filas(filas, B.cols)
+
+
+def multiplicar_dispersa_densa(A: MatrizCSR, B: List[List[Any]]) -> List[List[Any]]:
+    """A·B con A dispersa y B lista de listas; el resultado es denso."""
+    if A.cols != len(B):
+        raise ValueError("Para multiplicar: columnas de A deben coincidir con filas de B.")
+    cols_B = len(B[0])
+    enteras = all(type(x) is int for x in A.valores) and all(type(x) is int for fila in B for x in fila)
+    cero = 0 if enteras else Fraction(0)
+    resultado = []
+    for i in range(A.filas):
+        fila_res = [cero] * cols_B
+        for k_a in range(A.inicio[i], A.inicio[i + 1]):
+            a, fila_B = A.valores[k_a], B[A.columnas[k_a]]
+            for j in range(cols_B):
+                b = fila_B[j]
+                if b != 0:
+                    fila_res[j] += a * b
+        resultado.append(fila_res)
+    return resultado
+
+
+def sumar_dispersas(A: MatrizCSR, B: MatrizCSR, signo: int = 1) -> MatrizCSR:
+    """A + signo·B mezclando las filas ordenadas de ambas; las cancelaciones se descartan."""
+    if A.forma != B.forma:
+        raise ValueError("Para sumar: A y B deben tener el mismo tamaño.")
+    valores, columnas, inicio = [], [], [0]
+    for i in range(A.filas):
+        p, p_fin = A.inicio[i], A.inicio[i + 1]
+        q, q_fin = B.inicio[i], B.inicio[i + 1]
+        while p < p_fin or q < q_fin:
+            ca = A.columnas[p] if p < p_fin else A.cols
+            cb = B.columnas[q] if q < q_fin else B.cols
+            if ca < cb:
+                j, x = ca, A.valores[p]
+                p += 1
+            elif cb < ca:
+                j, x = cb, signo * B.valores[q]
+                q += 1
+            else:
+                j, x = ca, A.valores[p] + signo * B.valores[q]
+                p += 1
+                q += 1
+            if x != 0:
+                valores.append(x)
+                columnas.append(j)
+        inicio.append(len(valores))
+    return MatrizCSR(A.filas, A.cols, valores, columnas, inicio)
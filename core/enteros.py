@@ -0,0 +1,185 @@
+# core/enteros.py
+"""
+Camino rápido para matrices enteras.
+La mayoría de las matrices que se ingresan solo tienen enteros; operar con
+int evita crear y normalizar un Fraction en cada suma y producto. Las
+funciones de este módulo trabajan con int y solo pasan a Fraction cuando
+una división introduce denominadores (al final, una única vez).
+"""
+from fractions import Fraction
+from math import lcm
+from typing import List, Any, Optional, Tuple
+from soporte.formato_matrices import convertir_a_fraccion
+
+# =====================================================
+#   DETECCIÓN Y CONVERSIÓN
+# =====================================================
+
+def son_enteras(*matrices) -> bool:
+    """True si todas las entradas de todas las matrices ya son int (sin convertir)."""
+    return all(isinstance(x, int) for M in matrices for fila in M for x in fila)
+
+
+def a_enteros(M: List[List[Any]]) -> Optional[List[List[int]]]:
+    """Copia de M con int si todas las entradas son enteras; None en otro caso."""
+    resultado = []
+    for fila in M:
+        fila_int = []
+        for x in fila:
+            if type(x) is int:
+                fila_int.append(x)
+                continue
+            f = x if isinstance(x, Fraction) else convertir_a_fraccion(x)
+            if f.denominator != 1:
+                return None
+            fila_int.append(f.numerator)
+        resultado.append(fila_int)
+    return resultado
+
+
+def a_numeros(M: List[List[Any]]) -> List[List[Any]]:
+    """int si toda la matriz es entera; Fraction en otro caso."""
+    enteros = a_enteros(M)
+    if enteros is not None:
+        return enteros
+    return [[convertir_a_fraccion(x) for x in fila] for fila in M]
+
+
+def a_fracciones(M: List[List[Any]]) -> List[List[Fraction]]:
+    """
+    Vuelve a Fraction en la frontera (resultados que se devuelven a la interfaz).
+    Los float del backend flotante se dejan tal cual.
+    """
+    return [[Fraction(x) if type(x) is int else x for x in fila] for fila in M]
+
+
+def entero_o_none(c: Optional[Fraction]) -> Optional[Any]:
+    """Escalar como int si es entero (para no contaminar una matriz entera)."""
+    if c is not None and c.denominator == 1:
+        return c.numerator
+    return c
+
+
+# =====================================================
+#   BAREISS (ELIMINACIÓN LIBRE DE FRACCIONES)
+# =====================================================
+# En el paso k:  a_ij ← (a_kk·a_ij − a_ik·a_kj) / a_(k-1)(k-1)
+# La división es siempre exacta, así que todo permanece entero.
+
+def det_bareiss(M: List[List[int]]) -> int:
+    """Determinante exacto de una matriz entera cuadrada."""
+    n = len(M)
+    if n == 0:
+        return 1
+    A = [list(fila) for fila in M]
+    signo, previo = 1, 1
+    for k in range(n - 1):
+        if A[k][k] == 0:
+            cambio = next((i for i in range(k + 1, n) if A[i][k] != 0), None)
+            if cambio is None:
+                return 0
+            A[k], A[cambio] = A[cambio], A[k]
+            signo = -signo
+        akk = A[k][k]
+        fila_k = A[k]
+        for i in range(k + 1, n):
+            fila_i = A[i]
+            aik = fila_i[k]
+            for j in range(k + 1, n):
+                fila_i[j] = (akk * fila_i[j] - aik * fila_k[j]) // previo
+        previo = akk
+    return signo * A[n - 1][n - 1]
+
+
+def inversa_bareiss(M: List[List[int]]) -> Optional[Tuple[int, List[List[int]]]]:
+    """
+    Gauss–Jordan libre de fracciones sobre [A | I].
+    Devuelve (det(A), adj(A)) con enteros, de modo que A⁻¹ = adj(A) / det(A);
+    None si A es singular.
+    """
+    n = len(M)
+    Aum = [list(M[i]) + [int(i == j) for j in range(n)] for i in range(n)]
+    signo, previo = 1, 1
+    for k in range(n):
+        if Aum[k][k] == 0:
+            cambio = next((i for i in range(k + 1, n) if Aum[i][k] != 0), None)
+            if cambio is None:
+                return None
+            Aum[k], Aum[cambio] = Aum[cambio], Aum[k]
+            signo = -signo
+        akk = Aum[k][k]
+        fila_k = Aum[k]
+        for i in range(n):
+            if i == k:
+                continue
+            fila_i = Aum[i]
+            aik = fila_i[k]
+            for j in range(2 * n):
+                if j != k:
+                    fila_i[j] = (akk * fila_i[j] - aik * fila_k[j]) // previo
+            fila_i[k] = 0
+        previo = akk
+    # Tras el último paso la parte izquierda es det·I (salvo el signo de los intercambios)
+    det = Aum[0][0]
+    adj = [fila[n:] for fila in Aum]
+    if signo < 0:
+        det = -det
+        adj = [[-x for x in fila] for fila in adj]
+    return det, adj
+
+
+def filas_a_enteros(M: List[List[Any]]) -> List[List[int]]:
+    """
+    Multiplica cada fila racional por el mcm de sus denominadores.
+    Escalar filas por constantes ≠ 0 no cambia el rango.
+    """
+    resultado = []
+    for fila in M:
+        fr = [x if isinstance(x, Fraction) else Fraction(x) for x in fila]
+        mcm = lcm(*(x.denominator for x in fr)) if fr else 1
+        resultado.append([x.numerator * (mcm // x.denominator) for x in fr])
+    return resultado
+
+
+def rango_bareiss(M: List[List[int]]) -> int:
+    """
+    Rango exacto de una matriz entera por eliminación libre de fracciones.
+    Las filas que quedan en cero se descartan y el proceso termina en cuanto
+    no queda ninguna fila activa.
+    """
+    filas = [list(f) for f in M if any(f)]
+    if not filas:
+        return 0
+    n_cols = len(filas[0])
+    rango, previo = 0, 1
+    for col in range(n_cols):
+        piv = next((i for i, f in enumerate(filas) if f[col] != 0), None)
+        if piv is None:
+            continue
+        fila_p = filas.pop(piv)
+        akk = fila_p[col]
+        activas = []
+        for fila in filas:
+            aik = fila[col]
+            if aik == 0:
+                # a_ij ← a_kk·a_ij / previo (exacta también cuando a_ik = 0)
+                nueva = [(akk * x) // previo for x in fila]
+            else:
+                nueva = [(akk * x - aik * y) // previo for x, y in zip(fila, fila_p)]
+            if any(nueva):
+                activas.append(nueva)
+        filas = activas
+        previo = akk
+        rango += 1
+        if not filas:
+            break
+    return rango
+
+
+def inversa_enteros(M: List[List[int]]) -> Optional[List[List[Fraction]]]:
+    """A⁻¹ exacta para A entera: una sola división por det al final."""
+    res = inversa_bareiss(M)
+    if res is None:
+        return None
+    det, adj = res
+    return [[Fraction(x, det) for x in fila] for fila in adj]
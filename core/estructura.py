@@ -0,0 +1,201 @@
+# core/estructura.py
+"""
+Detección de estructura especial en O(n²) y kernels que la aprovechan.
+Identidad, diagonal, permutación, triangular y diagonal por bloques aparecen
+a menudo al encadenar operaciones (p. ej. A·A⁻¹ = I). Para ellas el producto
+y la inversa tienen atajos:
+    diagonal     → escalar filas/columnas, inversa diag(1/dᵢ)       O(n²) / O(n)
+    permutación  → reordenar filas/columnas, inversa Pᵀ            O(n²)
+    triangular   → sustitución hacia atrás/adelante                 sin pivoteo
+    bloques      → invertir cada bloque por separado
+"""
+from fractions import Fraction
+from typing import List, Any, Optional
+
+IDENTIDAD = "identidad"
+DIAGONAL = "diagonal"
+PERMUTACION = "permutacion"
+TRIANGULAR_SUPERIOR = "triangular_superior"
+TRIANGULAR_INFERIOR = "triangular_inferior"
+BLOQUES_DIAGONAL = "bloques_diagonal"
+
+NOMBRES = {
+    IDENTIDAD: "la identidad",
+    DIAGONAL: "diagonal",
+    PERMUTACION: "una matriz de permutación",
+    TRIANGULAR_SUPERIOR: "triangular superior",
+    TRIANGULAR_INFERIOR: "triangular inferior",
+    BLOQUES_DIAGONAL: "diagonal por bloques",
+}
+
+# =====================================================
+#   DETECCIÓN
+# =====================================================
+
+def _permutacion(M) -> Optional[List[int]]:
+    """σ con M[i][σ(i)] = 1 si M es de permutación; None en otro caso."""
+    n = len(M)
+    sigma, usadas = [], set()
+    for fila in M:
+        pos = None
+        for j, x in enumerate(fila):
+            if x == 0:
+                continue
+            if x != 1 or pos is not None:
+                return None
+            pos = j
+        if pos is None or pos in usadas:
+            return None
+        usadas.add(pos)
+        sigma.append(pos)
+    return sigma if len(sigma) == n else None
+
+
+def bloques_diagonales(M) -> List[range]:
+    """
+    Rangos de índices de los bloques diagonales de M (uno solo si no se separa).
+    Un bloque termina en e cuando ninguna entrada no nula une {0…e} con {e+1…}.
+    """
+    n = len(M)
+    alcance = list(range(n))
+    for i, fila in enumerate(M):
+        for j, x in enumerate(fila):
+            if x != 0:
+                k = max(i, j)
+                if alcance[min(i, j)] < k:
+                    alcance[min(i, j)] = k
+    bloques, inicio, limite = [], 0, -1
+    for e in range(n):
+        limite = max(limite, alcance[e])
+        if limite <= e:
+            bloques.append(range(inicio, e + 1))
+            inicio = e + 1
+    return bloques
+
+
+def detectar_estructura(M) -> Optional[str]:
+    """Estructura especial de una matriz cuadrada (ver constantes), o None."""
+    n = len(M)
+    if n == 0 or any(len(fila) != n for fila in M):
+        return None
+    superior = all(M[i][j] == 0 for i in range(n) for j in range(i))
+    inferior = all(M[i][j] == 0 for i in range(n) for j in range(i + 1, n))
+    if superior and inferior:
+        return IDENTIDAD if all(M[i][i] == 1 for i in range(n)) else DIAGONAL
+    if _permutacion(M) is not None:
+        return PERMUTACION
+    if superior:
+        return TRIANGULAR_SUPERIOR
+    if inferior:
+        return TRIANGULAR_INFERIOR
+    if len(bloques_diagonales(M)) > 1:
+        return BLOQUES_DIAGONAL
+    return None
+
+
+# =====================================================
+#   PRODUCTOS
+# =====================================================
+
+def multiplicar_estructurado(A, B, estructura_A, estructura_B) -> Optional[List[List[Any]]]:
+    """
+    A·B con atajo si A o B es identidad, diagonal o de permutación.
+    None si ninguna de las dos tiene una estructura aprovechable.
+    """
+    if estructura_A == IDENTIDAD:
+        return [list(fila) for fila in B]
+    if estructura_B == IDENTIDAD:
+        return [list(fila) for fila in A]
+    if estructura_A == DIAGONAL:
+        return [[A[i][i] * x for x in fila] for i, fila in enumerate(B)]
+    if estructura_B == DIAGONAL:
+        d = [B[j][j] for j in range(len(B))]
+        return [[x * dj for x, dj in zip(fila, d)] for fila in A]
+    if estructura_A == PERMUTACION:
+        # (P·B)[i] = B[σ(i)]
+        return [list(B[k]) for k in _permutacion(A)]
+    if estructura_B == PERMUTACION:
+        # (A·P)[i][σ(k)] = A[i][k]
+        sigma = _permutacion(B)
+        resultado = []
+        for fila in A:
+            nueva = [0] * len(sigma)
+            for k, j in enumerate(sigma):
+                nueva[j] = fila[k]
+            resultado.append(nueva)
+        return resultado
+    return None
+
+
+# =====================================================
+#   INVERSAS
+# =====================================================
+
+def _inversa_triangular_superior(U) -> List[List[Fraction]]:
+    """U⁻¹ por sustitución hacia atrás, columna a columna (U⁻¹ también es triangular superior)."""
+    n = len(U)
+    X = [[Fraction(0)] * n for _ in range(n)]
+    for j in range(n):
+        X[j][j] = Fraction(1) / U[j][j]
+        for i in range(j - 1, -1, -1):
+            fila = U[i]
+            s = sum((fila[k] * X[k][j] for k in range(i + 1, j + 1) if fila[k] != 0), Fraction(0))
+            X[i][j] = -s / fila[i]
+    return X
+
+
+def inversa_estructurada(M, estructura):
+    """
+    (A⁻¹, det(A)) aprovechando la estructura; (None, 0) si A es singular.
+    Para bloques diagonales det se devuelve como None (no se calcula aparte).
+    """
+    n = len(M)
+    if estructura == IDENTIDAD:
+        return [[Fraction(int(i == j)) for j in range(n)] for i in range(n)], Fraction(1)
+
+    if estructura in (DIAGONAL, TRIANGULAR_SUPERIOR, TRIANGULAR_INFERIOR):
+        det = Fraction(1)
+        for i in range(n):
+            det *= M[i][i]
+        if det == 0:
+            return None, Fraction(0)
+        if estructura == DIAGONAL:
+            inv = [[Fraction(0)] * n for _ in range(n)]
+            for i in range(n):
+                inv[i][i] = Fraction(1) / M[i][i]
+            return inv, det
+        if estructura == TRIANGULAR_SUPERIOR:
+            return _inversa_triangular_superior(M), det
+        # L⁻¹ = ((Lᵀ)⁻¹)ᵀ y Lᵀ es triangular superior
+        inv_t = _inversa_triangular_superior([list(c) for c in zip(*M)])
+        return [list(c) for c in zip(*inv_t)], det
+
+    if estructura == PERMUTACION:
+        # P⁻¹ = Pᵀ;  det(P) = signo de σ (paridad por ciclos)
+        sigma = _permutacion(M)
+        inv = [[Fraction(0)] * n for _ in range(n)]
+        for i, j in enumerate(sigma):
+            inv[j][i] = Fraction(1)
+        visitados, transposiciones = set(), 0
+        for i in range(n):
+            largo = 0
+            while i not in visitados:
+                visitados.add(i)
+                i = sigma[i]
+                largo += 1
+            transposiciones += max(0, largo - 1)
+        return inv, Fraction(-1 if transposiciones % 2 else 1)
+
+    if estructura == BLOQUES_DIAGONAL:
+        from core.inversa_bloques import inversa_por_bloques
+        inv = [[Fraction(0)] * n for _ in range(n)]
+        for b in bloques_diagonales(M):
+            inv_b = inversa_por_bloques([[M[i][j] for j in b] for i in b])
+            if inv_b is None:
+                return None, Fraction(0)
+            for fila_b, i in zip(inv_b, b):
+                for x, j in zip(fila_b, b):
+                    inv[i][j] = x
+        return inv, None
+
+    raise ValueError(f"Estructura desconocida: {estructura}")
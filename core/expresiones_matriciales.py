@@ -0,0 +1,400 @@
+# core/expresiones_matriciales.py
+"""
+Motor de expresiones matriciales: 2A·B + A·B − (A·B)⁻¹
+- La expresión se analiza a un DAG: subárboles idénticos se representan
+  una sola vez (hash-consing), así A·B se calcula una única vez.
+- Las cadenas de productos se reordenan con la parentización óptima de
+  core.cadena_matrices; el orden elegido y su costo estimado se informan
+  antes de evaluar.
+- Los resultados intermedios quedan en una caché acotada (LRU) que vive
+  mientras dure la sesión del motor.
+"""
+import re
+from collections import OrderedDict
+from fractions import Fraction
+from typing import List, Any, Dict, Tuple
+from soporte.formato_matrices import convertir_a_fraccion, resultado_en_fracciones, resultado_en_decimales
+from core.operaciones_matrices import sumar, restar, multiplicar
+from core.inversa_bloques import inversa_por_bloques
+from core.cadena_matrices import orden_optimo, bits_promedio, parentizar, costo_izquierda_a_derecha
+from core.enteros import a_numeros, a_fracciones, entero_o_none
+
+# Resultados intermedios que se conservan entre evaluaciones
+MAX_CACHE_EXPRESIONES = 64
+
+_TOKENS = re.compile(r"""
+    \s*(?:
+        (?P<num>\d+(?:\.\d+)?(?:/\d+)?)
+      | (?P<nombre>[A-Za-z]\w*)
+      | (?P<inv>⁻¹|\^\(?-1\)?)
+      | (?P<op>[-+−*·×()])
+    )""", re.VERBOSE)
+
+# =====================================================
+#   ANÁLISIS LÉXICO
+# =====================================================
+
+def tokenizar(expresion: str) -> List[Tuple[str, str]]:
+    tokens, pos = [], 0
+    expresion = expresion.rstrip()
+    while pos < len(expresion):
+        m = _TOKENS.match(expresion, pos)
+        if not m:
+            raise ValueError(f"Símbolo no reconocido en la posición {pos + 1}: {expresion[pos:].strip()[:1]!r}")
+        tipo = m.lastgroup
+        valor = m.group(tipo)
+        if tipo == "op":
+            valor = {"−": "-", "×": "*", "·": "*"}.get(valor, valor)
+        tokens.append((tipo, valor))
+        pos = m.end()
+    return tokens
+
+
+# =====================================================
+#   CONSTRUCCIÓN DEL DAG (hash-consing)
+# =====================================================
+# Cada nodo se identifica por su clave estructural:
+#   ("mat", contenido) | ("num", Fraction) | (op, clave_hijo, ...)
+# Dos subexpresiones iguales producen la misma clave y por tanto el mismo nodo.
+
+class _Constructor:
+    def __init__(self, tokens, matrices):
+        self.tokens = tokens
+        self.pos = 0
+        self.matrices = matrices
+        self.nodos: Dict[tuple, Dict[str, Any]] = {}
+        self.usos: Dict[tuple, int] = {}
+        # Plan de cada cadena de 3 o más factores: {"cadena", "orden", "costo_estimado", "costo_izquierda"}
+        self.cadenas: List[Dict[str, Any]] = []
+
+    # ---------- tokens ----------
+    def _ver(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def _tomar(self):
+        tok = self._ver()
+        self.pos += 1
+        return tok
+
+    def _esperar(self, valor):
+        tipo, v = self._tomar()
+        if v != valor:
+            raise ValueError(f"Se esperaba '{valor}'.")
+
+    # ---------- nodos ----------
+    def _nodo(self, clave, forma, texto, hijos=()):
+        """Devuelve la clave del nodo, registrándolo una sola vez."""
+        if clave not in self.nodos:
+            self.nodos[clave] = {"forma": forma, "texto": texto, "hijos": hijos}
+            for h in hijos:
+                self.usos[h] = self.usos.get(h, 0) + 1
+        return clave
+
+    def _hoja_matriz(self, nombre):
+        if nombre not in self.matrices:
+            raise ValueError(f"Matriz desconocida: {nombre}")
+        M = self.matrices[nombre]
+        contenido = tuple(tuple(convertir_a_fraccion(x) for x in fila) for fila in M)
+        return self._nodo(("mat", contenido), (len(M), len(M[0])), nombre)
+
+    def _hoja_numero(self, valor: Fraction):
+        return self._nodo(("num", valor), None, str(valor))
+
+    def _forma(self, clave):
+        return self.nodos[clave]["forma"]
+
+    def _texto(self, clave):
+        return self.nodos[clave]["texto"]
+
+    def _escalar(self, c, m):
+        """c·M (o c·d si ambos son escalares)."""
+        if self._forma(m) is None:
+            return self._hoja_numero(c[1] * m[1])
+        if c[1] == 1:
+            return m
+        return self._nodo(("esc", c, m), self._forma(m), f"{self._texto(c)}{self._texto(m)}", (c, m))
+
+    def _producto(self, a, b):
+        fa, fb = self._forma(a), self._forma(b)
+        if fa[1] != fb[0]:
+            raise ValueError(
+                f"Dimensiones incompatibles en {self._texto(a)}·{self._texto(b)}: "
+                f"{fa[0]}×{fa[1]} y {fb[0]}×{fb[1]}."
+            )
+        return self._nodo(("mul", a, b), (fa[0], fb[1]),
+                          f"{self._envolver(a)}·{self._envolver(b)}", (a, b))
+
+    def _envolver(self, clave):
+        texto = self._texto(clave)
+        return f"({texto})" if clave[0] in ("sum", "res", "esc", "neg") else texto
+
+    def _cadena(self, factores):
+        """Producto de varias matrices con la parentización más barata."""
+        if len(factores) == 1:
+            return factores[0]
+        dims = [self._forma(factores[0])[0]] + [self._forma(f)[1] for f in factores]
+        for a, b in zip(factores, factores[1:]):
+            if self._forma(a)[1] != self._forma(b)[0]:
+                self._producto(a, b)  # lanza el error con el mensaje adecuado
+        bits = [bits_promedio(f[1]) if f[0] == "mat" else 1.0 for f in factores]
+        costo, corte = orden_optimo(dims, bits)
+        if len(factores) > 2:
+            textos = [self._envolver(f) for f in factores]
+            self.cadenas.append({
+                "cadena": "·".join(textos),
+                "orden": parentizar(corte, textos, 0, len(factores) - 1),
+                "costo_estimado": costo,
+                "costo_izquierda": costo_izquierda_a_derecha(dims, bits),
+            })
+
+        def armar(i, j):
+            if i == j:
+                return factores[i]
+            s = corte[i][j]
+            return self._producto(armar(i, s), armar(s + 1, j))
+        return armar(0, len(factores) - 1)
+
+    # ---------- gramática ----------
+    # expr    := termino (('+'|'-') termino)*
+    # termino := unario ('*'? unario)*
+    # unario  := '-' unario | primario ('⁻¹')*
+    # primario:= número | nombre | '(' expr ')'
+    def expresion(self):
+        izq = self.termino()
+        while self._ver()[1] in ("+", "-"):
+            op = self._tomar()[1]
+            der = self.termino()
+            fi, fd = self._forma(izq), self._forma(der)
+            if (fi is None) != (fd is None) or (fi and fi != fd):
+                raise ValueError(
+                    f"No se puede {'sumar' if op == '+' else 'restar'} "
+                    f"{self._texto(izq)} y {self._texto(der)}: tamaños distintos."
+                )
+            if fi is None:
+                izq = self._hoja_numero(izq[1] + der[1] if op == "+" else izq[1] - der[1])
+            else:
+                clave = ("sum" if op == "+" else "res", izq, der)
+                izq = self._nodo(clave, fi, f"{self._texto(izq)} {'+' if op == '+' else '−'} {self._texto(der)}", (izq, der))
+        return izq
+
+    def termino(self):
+        factores = [self.unario()]
+        while True:
+            tipo, valor = self._ver()
+            if valor == "*":
+                self._tomar()
+            elif not (tipo in ("num", "nombre") or valor == "("):
+                break
+            factores.append(self.unario())
+
+        # Los escalares se agrupan al frente: c·(M1·M2·…·Mk)
+        coef = Fraction(1)
+        matrices = []
+        for f in factores:
+            if self._forma(f) is None:
+                coef *= f[1]
+            else:
+                matrices.append(f)
+        if not matrices:
+            return self._hoja_numero(coef)
+        return self._escalar(self._hoja_numero(coef), self._cadena(matrices))
+
+    def unario(self):
+        if self._ver()[1] == "-":
+            self._tomar()
+            x = self.unario()
+            if self._forma(x) is None:
+                return self._hoja_numero(-x[1])
+            return self._nodo(("neg", x), self._forma(x), f"−{self._envolver(x)}", (x,))
+        x = self.primario()
+        while self._ver()[0] == "inv":
+            self._tomar()
+            forma = self._forma(x)
+            if forma is None:
+                if x[1] == 0:
+                    raise ValueError("División entre cero.")
+                x = self._hoja_numero(1 / x[1])
+                continue
+            if forma[0] != forma[1]:
+                raise ValueError(f"{self._texto(x)} no es cuadrada: no tiene inversa.")
+            texto = self._texto(x)
+            texto = f"({texto})⁻¹" if x[0] != "mat" else f"{texto}⁻¹"
+            x = self._nodo(("inv", x), forma, texto, (x,))
+        return x
+
+    def primario(self):
+        tipo, valor = self._tomar()
+        if tipo == "num":
+            return self._hoja_numero(Fraction(valor))
+        if tipo == "nombre":
+            return self._hoja_matriz(valor)
+        if valor == "(":
+            x = self.expresion()
+            self._esperar(")")
+            return x
+        raise ValueError("Expresión incompleta." if tipo is None else f"Símbolo inesperado: {valor}")
+
+
+def construir_dag(expresion: str, matrices: Dict[str, List[List[Any]]]):
+    """
+    Devuelve (clave_raíz, nodos, usos, cadenas) o lanza ValueError si la expresión no es válida.
+    'cadenas' lista el orden elegido y el costo estimado de cada cadena de productos reordenada.
+    """
+    c = _Constructor(tokenizar(expresion), matrices)
+    if not c.tokens:
+        raise ValueError("Expresión vacía.")
+    raiz = c.expresion()
+    if c.pos != len(c.tokens):
+        raise ValueError(f"Símbolo inesperado: {c._ver()[1]}")
+    return raiz, c.nodos, c.usos, c.cadenas
+
+
+# =====================================================
+#   EVALUACIÓN CON CACHÉ DE SESIÓN
+# =====================================================
+
+class MotorExpresiones:
+    """Evalúa expresiones conservando los resultados intermedios entre llamadas."""
+
+    def __init__(self, max_cache: int = MAX_CACHE_EXPRESIONES):
+        self.max_cache = max_cache
+        self._cache: "OrderedDict[tuple, List[List[Fraction]]]" = OrderedDict()
+
+    def limpiar(self):
+        self._cache.clear()
+
+    def _guardar(self, clave, valor):
+        self._cache[clave] = valor
+        self._cache.move_to_end(clave)
+        while len(self._cache) > self.max_cache:
+            self._cache.popitem(last=False)
+
+    def _calcular(self, clave, valores):
+        op = clave[0]
+        if op == "mat":
+            return a_numeros(clave[1])
+        if op == "esc":
+            c = entero_o_none(clave[1][1])
+            return [[c * x for x in fila] for fila in valores[clave[2]]]
+        if op == "neg":
+            return [[-x for x in fila] for fila in valores[clave[1]]]
+        if op == "sum":
+            return sumar(valores[clave[1]], valores[clave[2]])
+        if op == "res":
+            return restar(valores[clave[1]], valores[clave[2]])
+        if op == "mul":
+            return multiplicar(valores[clave[1]], valores[clave[2]])
+        if op == "inv":
+            inv = inversa_por_bloques(valores[clave[1]])
+            if inv is None:
+                raise ArithmeticError("singular")
+            return inv
+        raise ValueError(f"Operación desconocida: {op}")
+
+    def evaluar(self, expresion: str, matrices: Dict[str, List[List[Any]]]) -> Dict[str, Any]:
+        try:
+            raiz, nodos, usos, cadenas = construir_dag(expresion, matrices)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        if raiz[0] == "num":
+            return {"error": "La expresión no contiene matrices."}
+
+        valores: Dict[tuple, List[List[Fraction]]] = {}
+        nombres: Dict[tuple, str] = {}
+        pasos = []
+        calculados = reutilizados = 0
+
+        def visitar(clave):
+            nonlocal calculados, reutilizados
+            if clave in valores or clave[0] == "num":
+                return
+            if clave[0] == "mat":
+                valores[clave] = self._calcular(clave, valores)
+                nombres[clave] = nodos[clave]["texto"]
+                return
+            # Si el nodo ya está en la caché no hace falta evaluar sus hijos
+            en_cache = clave in self._cache
+            if not en_cache:
+                for h in nodos[clave]["hijos"]:
+                    visitar(h)
+
+            nombre = f"T{len(pasos) + 1}"
+            # Un hijo sin nombre Tk (no visitado por acierto de caché) se muestra entre paréntesis
+            partes = [nombres.get(h) or (nodos[h]["texto"] if h[0] in ("mat", "num") else f"({nodos[h]['texto']})")
+                      for h in nodos[clave]["hijos"]]
+            texto = _texto_operacion(clave[0], partes)
+
+            if en_cache:
+                self._cache.move_to_end(clave)
+                valores[clave] = self._cache[clave]
+                reutilizados += 1
+                origen = "  (tomado de la caché)"
+            else:
+                try:
+                    valores[clave] = self._calcular(clave, valores)
+                except ArithmeticError:
+                    raise ValueError(f"{nodos[clave]['texto']} no es invertible (determinante = 0).")
+                self._guardar(clave, valores[clave])
+                calculados += 1
+                origen = ""
+            nombres[clave] = nombre
+            veces = usos.get(clave, 0)
+            reuso = f"  — se usa {veces} veces" if veces > 1 else ""
+            pasos.append(f"{nombre} = {texto}{origen}{reuso}")
+
+        try:
+            visitar(raiz)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        resultado = a_fracciones(valores[raiz])
+        operaciones = sum(1 for k in nodos if k[0] not in ("mat", "num"))
+        procedimiento = [
+            f"Expresión: {expresion.strip()}",
+            f"Forma analizada: {nodos[raiz]['texto']}",
+            f"Subexpresiones distintas: {operaciones}  "
+            f"(calculadas: {calculados}, reutilizadas de la caché: {reutilizados})",
+            *_texto_cadenas(cadenas),
+            "",
+            *pasos,
+            "\nResultado:",
+            resultado_en_fracciones(resultado),
+        ]
+        return {
+            "procedimiento": "\n".join(procedimiento),
+            "resultado_lista": resultado,
+            "resultado_frac": resultado_en_fracciones(resultado),
+            "resultado_dec": resultado_en_decimales(resultado),
+            "cadenas": cadenas,
+        }
+
+
+def _texto_cadenas(cadenas):
+    """Orden óptimo y costo estimado de cada cadena reordenada."""
+    lineas = []
+    for plan in cadenas:
+        lineas += [
+            "",
+            f"Cadena de productos: {plan['cadena']}",
+            f"Orden óptimo (programación dinámica): {plan['orden']}",
+            f"Costo estimado: {plan['costo_estimado']:,.0f} multiplicaciones ponderadas por tamaño de entrada",
+            f"Costo de izquierda a derecha: {plan['costo_izquierda']:,.0f}",
+        ]
+    return lineas
+
+
+def _texto_operacion(op, partes):
+    if op == "esc":
+        return f"{partes[0]}·{partes[1]}"
+    if op == "neg":
+        return f"−{partes[0]}"
+    if op == "sum":
+        return f"{partes[0]} + {partes[1]}"
+    if op == "res":
+        return f"{partes[0]} − {partes[1]}"
+    if op == "mul":
+        return f"{partes[0]}·{partes[1]}"
+    if op == "inv":
+        return f"{partes[0]}⁻¹"
+    return op
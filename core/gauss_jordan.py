@@ -3,6 +3,7 @@ from fractions import Fraction
 from typing import List, Tuple, Dict, Any
 from soporte.formato_matrices import matriz_alineada_con_titulo
 from soporte.validaciones import fraccion_a_str
+from core.backend_numerico import usa_flotante, rref_flotante, solucion_unica_flotante
 
 # =====================================================
 #     FUNCIONES AUXILIARES
@@ -164,14 +165,31 @@ def _solucion_parametrica_desde_rref(rref: List[List[Fraction]], columnas_pivote
 #     FUNCIÓN PRINCIPAL: GAUSS-JORDAN COMPLETO
 # =====================================================
 
-def clasificar_y_resolver_gauss_jordan(matriz_aumentada: List[List[Fraction]]) -> Dict[str, Any]:
+def clasificar_y_resolver_gauss_jordan(matriz_aumentada: List[List[Fraction]], backend=None) -> Dict[str, Any]:
     """
     Ejecuta el método de Gauss-Jordan y clasifica el sistema:
       - 'única': solución única
       - 'infinita': solución paramétrica
       - 'inconsistente': sin solución
+    Con backend "flotante" (ver core.backend_numerico) la RREF se calcula en float64
+    con NumPy y sin pasos intermedios.
     """
-    pasos_mat, rref, columnas_pivote = _a_rref_con_pasos(matriz_aumentada)
+    if usa_flotante(backend):
+        pasos_mat = ["Backend flotante (NumPy float64): sin pasos intermedios, resultados aproximados."]
+        x = solucion_unica_flotante(matriz_aumentada)
+        if x is not None:
+            return {
+                "pasos": pasos_mat,
+                "rref": None,
+                "columnas_pivote": None,
+                "tipo_solucion": "única",
+                "soluciones": x,
+                "mensaje_tipo": "Solución única.",
+                "solucion_parametrica": None
+            }
+        rref, columnas_pivote = rref_flotante(matriz_aumentada)
+    else:
+        pasos_mat, rref, columnas_pivote = _a_rref_con_pasos(matriz_aumentada)
     nvars = len(matriz_aumentada[0]) - 1
 
     rango_a = _rango_por_forma(rref, incluir_b=False, nvars=nvars)
@@ -180,6 +198,7 @@ def clasificar_y_resolver_gauss_jordan(matriz_aumentada: List[List[Fraction]]) -
     resultado = {
         "pasos": pasos_mat,
         "rref": rref,
+        "columnas_pivote": columnas_pivote,
         "tipo_solucion": None,
         "soluciones": None,
         "mensaje_tipo": "",
@@ -0,0 +1,106 @@
+# core/inversa_bloques.py
+from fractions import Fraction
+from typing import List, Optional
+from soporte.formato_matrices import convertir_a_fraccion
+from core.operaciones_matrices import multiplicar, restar
+from core.enteros import a_enteros, inversa_enteros
+
+# A partir de este orden conviene la inversa por bloques frente a Gauss–Jordan con pasos
+UMBRAL_BLOQUES = 60
+
+# Bloques de este tamaño o menores se invierten directamente con Gauss–Jordan
+CORTE_BASE = 16
+
+# =====================================================
+#   FUNCIONES AUXILIARES
+# =====================================================
+
+def _negar(A):
+    return [[-a for a in fila] for fila in A]
+
+
+def _bloque(M, filas, cols):
+    return [M[i][cols] for i in filas]
+
+
+def _inversa_gauss_jordan(A) -> Optional[List[List[Fraction]]]:
+    """Inversa por Gauss–Jordan sobre [A | I] sin generar texto. None si A es singular."""
+    A_int = a_enteros(A)
+    if A_int is not None:
+        return inversa_enteros(A_int)
+    n = len(A)
+    Aum = [list(A[i]) + [Fraction(int(i == j)) for j in range(n)] for i in range(n)]
+
+    for col in range(n):
+        pivote_fila = next((f for f in range(col, n) if Aum[f][col] != 0), None)
+        if pivote_fila is None:
+            return None
+        if pivote_fila != col:
+            Aum[col], Aum[pivote_fila] = Aum[pivote_fila], Aum[col]
+
+        fila_piv = Aum[col]
+        pivote = fila_piv[col]
+        if pivote != 1:
+            for c in range(col, 2 * n):
+                fila_piv[c] /= pivote
+
+        for r in range(n):
+            if r == col:
+                continue
+            fila = Aum[r]
+            factor = fila[col]
+            if factor == 0:
+                continue
+            for c in range(col, 2 * n):
+                if fila_piv[c] != 0:
+                    fila[c] -= factor * fila_piv[c]
+
+    return [fila[n:] for fila in Aum]
+
+
+# =====================================================
+#   INVERSA RECURSIVA POR COMPLEMENTO DE SCHUR
+# =====================================================
+
+def _inversa_recursiva(A) -> Optional[List[List[Fraction]]]:
+    n = len(A)
+    if n <= CORTE_BASE:
+        return _inversa_gauss_jordan(A)
+
+    k = n // 2
+    sup, inf = range(k), range(k, n)
+    P = _bloque(A, sup, slice(0, k))
+    Q = _bloque(A, sup, slice(k, n))
+    R = _bloque(A, inf, slice(0, k))
+    S = _bloque(A, inf, slice(k, n))
+
+    P_inv = _inversa_recursiva(P)
+    if P_inv is None:
+        # P singular no implica A singular: se invierte el bloque completo
+        return _inversa_gauss_jordan(A)
+
+    P_inv_Q = multiplicar(P_inv, Q)
+    R_P_inv = multiplicar(R, P_inv)
+
+    # Complemento de Schur: S' = S − R·P⁻¹·Q  (A invertible ⇔ S' invertible)
+    schur = restar(S, multiplicar(R, P_inv_Q))
+    schur_inv = _inversa_recursiva(schur)
+    if schur_inv is None:
+        return None
+
+    X12 = _negar(multiplicar(P_inv_Q, schur_inv))
+    X21 = _negar(multiplicar(schur_inv, R_P_inv))
+    X11 = restar(P_inv, multiplicar(X12, R_P_inv))
+
+    return [X11[i] + X12[i] for i in range(k)] + [X21[i] + schur_inv[i] for i in range(n - k)]
+
+
+def inversa_por_bloques(M) -> Optional[List[List[Fraction]]]:
+    """
+    Calcula A⁻¹ de forma exacta dividiendo A en bloques 2×2:
+        A = [[P, Q], [R, S]],   S' = S − R·P⁻¹·Q
+        A⁻¹ = [[P⁻¹ + P⁻¹Q·S'⁻¹·R·P⁻¹, −P⁻¹Q·S'⁻¹], [−S'⁻¹·R·P⁻¹, S'⁻¹]]
+    Devuelve None si la matriz es singular.
+    """
+    A = [[convertir_a_fraccion(x) for x in fila] for fila in M]
+    return _inversa_recursiva(A)
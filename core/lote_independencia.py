@@ -0,0 +1,62 @@
+# core/lote_independencia.py
+"""
+Análisis de independencia en lote (validaciones fuera de línea).
+Los conjuntos se leen del iterable por bloques y se reparten entre procesos;
+los resultados se entregan en el mismo orden y con el mismo formato que
+analizar_independencia. El tamaño de cada bloque se ajusta a las dimensiones
+de los conjuntos: bloques grandes para conjuntos pequeños (menos envíos entre
+procesos) y bloques cortos para conjuntos grandes (mejor reparto).
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Any, Dict, Optional
+from core.solucion_dependencia import analizar_independencia
+
+# Entradas (vectores × dimensión) que se buscan por bloque
+ENTRADAS_POR_BLOQUE = 20_000
+MAX_CONJUNTOS_POR_BLOQUE = 2_000
+
+# Bloques enviados por proceso antes de esperar resultados
+BLOQUES_EN_VUELO = 2
+
+
+def tam_bloque(conjunto: List[List[Any]]) -> int:
+    """Cuántos conjuntos de este tamaño van en un bloque."""
+    entradas = len(conjunto) * (len(conjunto[0]) if conjunto else 1)
+    return max(1, min(MAX_CONJUNTOS_POR_BLOQUE, ENTRADAS_POR_BLOQUE // max(1, entradas)))
+
+
+def _bloques(conjuntos: Iterable[List[List[Any]]]) -> Iterator[List[List[List[Any]]]]:
+    it = iter(conjuntos)
+    for primero in it:
+        yield [primero, *islice(it, tam_bloque(primero) - 1)]
+
+
+def _analizar_bloque(bloque):
+    return [analizar_independencia(vectores) for vectores in bloque]
+
+
+def analizar_independencia_lote(
+    conjuntos: Iterable[List[List[Any]]], procesos: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Genera analizar_independencia(c) para cada conjunto c, en orden.
+    El iterable se consume a medida que avanza (no se carga completo en memoria).
+    procesos=1 analiza en el proceso actual, sin pool.
+    """
+    if procesos == 1:
+        for bloque in _bloques(conjuntos):
+            yield from _analizar_bloque(bloque)
+        return
+
+    procesos = procesos or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        pendientes = deque()
+        for bloque in _bloques(conjuntos):
+            pendientes.append(pool.submit(_analizar_bloque, bloque))
+            if len(pendientes) >= BLOQUES_EN_VUELO * procesos:
+                yield from pendientes.popleft().result()
+        while pendientes:
+            yield from pendientes.popleft().result()
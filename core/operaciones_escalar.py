@@ -7,36 +7,29 @@ from soporte.formato_matrices import (
 )
 
 # =====================================================
-#   MULTIPLICACIÓN ESCALAR CON PROCEDIMIENTO (ALINEADA)
+#   ESCALARES: LECTURA Y PRODUCTO SIN FORMATO
 # =====================================================
-def escalar_matriz_con_pasos(matriz, escalar, nombre="A"):
+def leer_escalar(escalar, nombre, avisos):
     """
-    Multiplica una matriz por un escalar mostrando el procedimiento alineado.
-    Alinea dinámicamente las matrices según el ancho del escalar.
-
-    Ejemplo:
-    Matriz 2 × A:
-
-         [ 1  2  3 ]     [  2  4  6 ]
-    2 ⋅ [ 4  5  6 ]  = [  8 10 12 ]
-         [ 7  8  9 ]     [ 14 16 18 ]
+    Devuelve el escalar como Fraction, o None si no hay que escalar
+    (vacío o "1"). Si no es un número válido se anota un aviso y se ignora.
     """
+    if not escalar or escalar in ("", "1"):
+        return None
     try:
-        escalar_frac = Fraction(escalar)
-    except Exception:
-        return {"error": f"Escalar inválido: {escalar}"}
+        return Fraction(escalar)
+    except (ValueError, ZeroDivisionError) as e:
+        avisos.append(f"[Advertencia] Escalar {nombre} inválido ({escalar}): {e}")
+        return None
 
-    filas, cols = len(matriz), len(matriz[0])
-    resultado = []
 
-    for i in range(filas):
-        fila_res = []
-        for j in range(cols):
-            val = Fraction(matriz[i][j])
-            fila_res.append(val * escalar_frac)
-        resultado.append(fila_res)
+def escalar_matriz(matriz, escalar_frac):
+    """c·M sin generar texto."""
+    return [[Fraction(x) * escalar_frac for x in fila] for fila in matriz]
 
-    # Convertir matrices a texto
+
+def _bloque_escalar(matriz, resultado, escalar_frac, nombre):
+    """Texto alineado 'c ⋅ M = c·M'."""
     mat_original = formatear_matriz(matriz).split("\n")
     mat_result = formatear_matriz(resultado).split("\n")
 
@@ -63,7 +56,31 @@ def escalar_matriz_con_pasos(matriz, escalar, nombre="A"):
             )
         bloque.append(linea)
 
-    proc_texto = "\n".join(bloque) + "\n"
+    return "\n".join(bloque) + "\n"
+
+
+# =====================================================
+#   MULTIPLICACIÓN ESCALAR CON PROCEDIMIENTO (ALINEADA)
+# =====================================================
+def escalar_matriz_con_pasos(matriz, escalar, nombre="A"):
+    """
+    Multiplica una matriz por un escalar mostrando el procedimiento alineado.
+    Alinea dinámicamente las matrices según el ancho del escalar.
+
+    Ejemplo:
+    Matriz 2 × A:
+
+         [ 1  2  3 ]     [  2  4  6 ]
+    2 ⋅ [ 4  5  6 ]  = [  8 10 12 ]
+         [ 7  8  9 ]     [ 14 16 18 ]
+    """
+    try:
+        escalar_frac = Fraction(escalar)
+    except Exception:
+        return {"error": f"Escalar inválido: {escalar}"}
+
+    resultado = escalar_matriz(matriz, escalar_frac)
+    proc_texto = _bloque_escalar(matriz, resultado, escalar_frac, nombre)
 
     return {
         "procedimiento": proc_texto,
@@ -76,40 +93,42 @@ def escalar_matriz_con_pasos(matriz, escalar, nombre="A"):
 # =====================================================
 #   CONSTRUCCIÓN DEL PROCEDIMIENTO CON ESCALARES
 # =====================================================
-def construir_procedimiento_con_escalares(A_raw, B_raw, escalar_A, escalar_B, simbolo):
+def construir_procedimiento_con_escalares(A_raw, B_raw, escalar_A, escalar_B, simbolo, detalle=True):
     """
-    Construye el texto del procedimiento general cuando hay escalares.
-    Si no hay escalares, genera el procedimiento clásico como antes.
+    Lee los escalares y, solo si detalle=True, construye el texto del procedimiento
+    (bloques 'c ⋅ M' y encabezado con las matrices ya escaladas).
+    Las matrices escaladas únicamente se materializan para mostrarlas: el cálculo
+    lo hacen los kernels fusionados de core.operaciones_matrices con α y β.
     Devuelve:
         procedimiento_texto (str),
-        A_escalada (list),
-        B_escalada (list)
+        alfa, beta (Fraction o None si no se escala),
+        A_escalada, B_escalada (list, o None si detalle=False)
     """
+    avisos = []
+    alfa = leer_escalar(escalar_A, "A", avisos)
+    beta = leer_escalar(escalar_B, "B", avisos)
     procedimiento = []
+    for aviso in avisos:
+        procedimiento.extend([aviso, ""])
+
+    if not detalle:
+        nombre_A = f"{alfa}·A" if alfa is not None else "A"
+        nombre_B = f"{beta}·B" if beta is not None else "B"
+        procedimiento.append(f"Operación {nombre_A} {simbolo} {nombre_B}")
+        return "\n".join(procedimiento), alfa, beta, None, None
+
     A_result, B_result = A_raw, B_raw  # sin cambios iniciales
 
     # =====================================================
-    #   BLOQUE ESCALAR A
+    #   BLOQUES ESCALARES A Y B
     # =====================================================
-    if escalar_A and escalar_A not in ("", "1"):
-        try:
-            paso_A = escalar_matriz_con_pasos(A_raw, escalar_A, "A")
-            procedimiento.append(paso_A["procedimiento"])
-            A_result = paso_A["resultado_lista"]
-        except Exception as e:
-            procedimiento.append(f"[Advertencia] Escalar A inválido ({escalar_A}): {e}")
+    if alfa is not None:
+        A_result = escalar_matriz(A_raw, alfa)
+        procedimiento.append(_bloque_escalar(A_raw, A_result, alfa, "A"))
         procedimiento.append("")
-
-    # =====================================================
-    #   BLOQUE ESCALAR B
-    # =====================================================
-    if escalar_B and escalar_B not in ("", "1"):
-        try:
-            paso_B = escalar_matriz_con_pasos(B_raw, escalar_B, "B")
-            procedimiento.append(paso_B["procedimiento"])
-            B_result = paso_B["resultado_lista"]
-        except Exception as e:
-            procedimiento.append(f"[Advertencia] Escalar B inválido ({escalar_B}): {e}")
+    if beta is not None:
+        B_result = escalar_matriz(B_raw, beta)
+        procedimiento.append(_bloque_escalar(B_raw, B_result, beta, "B"))
         procedimiento.append("")
 
     # =====================================================
@@ -119,6 +138,4 @@ def construir_procedimiento_con_escalares(A_raw, B_raw, escalar_A, escalar_B, si
     procedimiento.append(construir_procedimiento(A_result, B_result, simbolo))
     procedimiento.append("")  # salto visual
 
-    return "\n".join(procedimiento), A_result, B_result
-
-
+    return "\n".join(procedimiento), alfa, beta, A_result, B_result
@@ -1,41 +1,340 @@
+from collections import OrderedDict
 from fractions import Fraction
 from core.operaciones_escalar import construir_procedimiento_con_escalares
+from core.strassen import multiplicar_strassen, corte_para
+from core.enteros import a_numeros, a_fracciones, entero_o_none, son_enteras
+from core.dispersa import (
+    MatrizCSR,
+    conviene_dispersa,
+    multiplicar_dispersas,
+    multiplicar_dispersa_densa,
+    sumar_dispersas,
+    ORDEN_MIN_DISPERSA,
+)
+from core.estructura import detectar_estructura, multiplicar_estructurado, NOMBRES
+from core.backend_numerico import (
+    BACKEND_EXACTO,
+    backend_activo,
+    usa_flotante,
+    sumar_flotante,
+    restar_flotante,
+    combinar_flotante,
+    multiplicar_flotante,
+)
 from soporte.formato_matrices import formatear_matriz, construir_procedimiento
 from soporte.formato_matrices import (
-    convertir_a_fraccion,
     envolver_valor,
     formatear_detalle_operacion,
     resultado_en_fracciones,
     resultado_en_decimales,
 )
 
+# Por encima de este número de términos el detalle de operación se omite
+LIMITE_DETALLE = 10_000
+
+# Filas de A·x que se explican (fila i · x) en el producto matriz–vector
+LIMITE_FILAS_VECTOR = 10
+
+# Matrices distintas cuyas cadenas de cuadrados A, A², A⁴, … se conservan
+MAX_CACHE_POTENCIAS = 16
+
+
+# =====================================================
+#    KERNELS NUMÉRICOS (SIN FORMATO)
+# =====================================================
+def _csr(M):
+    return M if isinstance(M, MatrizCSR) else MatrizCSR.desde_lista(M)
+
+
+def sumar(A, B, backend=BACKEND_EXACTO):
+    """A + B elemento a elemento, sin generar texto. Con operandos MatrizCSR el resultado es CSR."""
+    if isinstance(A, MatrizCSR) or isinstance(B, MatrizCSR):
+        return sumar_dispersas(_csr(A), _csr(B))
+    if usa_flotante(backend):
+        return sumar_flotante(A, B)
+    return [[a + b for a, b in zip(fila_A, fila_B)] for fila_A, fila_B in zip(A, B)]
+
+
+def restar(A, B, backend=BACKEND_EXACTO):
+    """A − B elemento a elemento, sin generar texto. Con operandos MatrizCSR el resultado es CSR."""
+    if isinstance(A, MatrizCSR) or isinstance(B, MatrizCSR):
+        return sumar_dispersas(_csr(A), _csr(B), signo=-1)
+    if usa_flotante(backend):
+        return restar_flotante(A, B)
+    return [[a - b for a, b in zip(fila_A, fila_B)] for fila_A, fila_B in zip(A, B)]
+
+
+def multiplicar(A, B, metodo="auto", backend=BACKEND_EXACTO):
+    """
+    Producto A·B sin generar texto.
+    - metodo="clasico": recorre i-k-j saltando los ceros.
+    - metodo="strassen": Strassen–Winograd con el corte afinado (core/strassen.py).
+    - metodo="dispersa": producto CSR que solo recorre entradas no nulas (core/dispersa.py).
+    - metodo="auto": Strassen solo cuando todas las dimensiones superan ese corte;
+      CSR si las matrices son grandes y casi todas sus entradas son cero.
+    Con backend="flotante" (y NumPy instalado) se usa el producto float64 vectorizado.
+    Si A y B son enteras (int) el producto se acumula en int.
+    Operandos MatrizCSR: CSR·CSR devuelve CSR; si alguno es denso el resultado es denso.
+    """
+    if isinstance(A, MatrizCSR):
+        if isinstance(B, MatrizCSR):
+            return multiplicar_dispersas(A, B)
+        return multiplicar_dispersa_densa(A, B)
+    if isinstance(B, MatrizCSR):
+        return multiplicar_dispersas(MatrizCSR.desde_lista(A), B).a_lista(Fraction(0))
+    if usa_flotante(backend):
+        return multiplicar_flotante(A, B)
+    if metodo == "dispersa" or (
+        metodo == "auto" and min(len(A), len(B), len(B[0])) >= ORDEN_MIN_DISPERSA and conviene_dispersa(A, B)
+    ):
+        cero = 0 if son_enteras(A, B) else Fraction(0)
+        return multiplicar_dispersas(MatrizCSR.desde_lista(A), MatrizCSR.desde_lista(B)).a_lista(cero)
+    if metodo == "strassen":
+        return multiplicar_strassen(A, B)
+    if metodo == "auto" and min(len(A), len(B), len(B[0])) > corte_para(A, B):
+        return multiplicar_strassen(A, B)
+
+    cols_B = len(B[0])
+    cero = 0 if son_enteras(A, B) else Fraction(0)
+    resultado = []
+    for fila_A in A:
+        fila_res = [cero] * cols_B
+        for k, a in enumerate(fila_A):
+            if a == 0:
+                continue
+            fila_B = B[k]
+            for j in range(cols_B):
+                b = fila_B[j]
+                if b != 0:
+                    fila_res[j] += a * b
+        resultado.append(fila_res)
+    return resultado
+
+
+# =====================================================
+#    KERNELS FUSIONADOS CON ESCALARES
+# =====================================================
+def combinar_escalado(A, B, alfa=None, beta=None, signo=1, backend=BACKEND_EXACTO):
+    """
+    α·A + signo·β·B en una sola pasada, sin construir α·A ni β·B.
+    alfa/beta = None equivalen a 1 (no se multiplica).
+    """
+    b = 1 if beta is None else beta
+    if signo < 0:
+        b = -b
+    if usa_flotante(backend):
+        return combinar_flotante(A, B, 1 if alfa is None else alfa, b)
+    if alfa is None:
+        if b == 1:
+            return sumar(A, B)
+        if b == -1:
+            return restar(A, B)
+        return [[x + b * y for x, y in zip(fila_A, fila_B)] for fila_A, fila_B in zip(A, B)]
+    return [[alfa * x + b * y for x, y in zip(fila_A, fila_B)] for fila_A, fila_B in zip(A, B)]
+
+
+def multiplicar_escalado(A, B, alfa=None, beta=None, metodo="auto", backend=BACKEND_EXACTO):
+    """
+    (α·A)(β·B) = αβ·(A·B): el producto se hace con A y B originales y el
+    factor αβ se aplica una sola vez a cada fila del resultado, en su lugar.
+    Son m·n multiplicaciones extra en vez de m·k + k·n para escalar los operandos.
+    """
+    resultado = multiplicar(A, B, metodo, backend)
+    gamma = (1 if alfa is None else alfa) * (1 if beta is None else beta)
+    if gamma != 1:
+        if usa_flotante(backend):
+            gamma = float(gamma)
+        for fila in resultado:
+            for j, x in enumerate(fila):
+                if x != 0:
+                    fila[j] = x * gamma
+    return resultado
+
+
+# =====================================================
+#    MATRIZ–VECTOR
+# =====================================================
+def _como_vector(x):
+    """Acepta un vector plano o una matriz columna [[x1], [x2], …]."""
+    if x and isinstance(x[0], (list, tuple)):
+        return [fila[0] for fila in x]
+    return list(x)
+
+
+def multiplicar_vector(A, x, backend=BACKEND_EXACTO):
+    """A·x sin generar texto; x y el resultado son listas planas. Solo usa las x_k ≠ 0."""
+    return multiplicar_vectores(A, [x], backend)[0]
+
+
+def multiplicar_vectores(A, X, backend=BACKEND_EXACTO):
+    """
+    A·x para cada vector x de X (lote). Cada fila de A se recorre una vez
+    para todo el lote; de cada x solo se usan sus entradas no nulas.
+    """
+    if usa_flotante(backend):
+        columnas = multiplicar_flotante(A, [list(f) for f in zip(*X)])
+        return [list(c) for c in zip(*columnas)]
+    no_nulas = [[(k, v) for k, v in enumerate(x) if v != 0] for x in X]
+    enteras = all(type(v) is int for x in X for v in x) and son_enteras(A)
+    cero = 0 if enteras else Fraction(0)
+    resultados = [[cero] * len(A) for _ in X]
+    for i, fila in enumerate(A):
+        for res, nz in zip(resultados, no_nulas):
+            res[i] = sum((fila[k] * v for k, v in nz), cero)
+    return resultados
+
+
+# =====================================================
+#    PRODUCTO DE GRAM (SIMÉTRICO)
+# =====================================================
+def gram(A, transpuesta_primero=False):
+    """
+    A·Aᵀ (o Aᵀ·A con transpuesta_primero=True). El resultado es simétrico:
+    solo se calcula el triángulo superior, n(n+1)/2 productos escalares, y se refleja.
+    """
+    filas = [list(c) for c in zip(*A)] if transpuesta_primero else A
+    n = len(filas)
+    cero = 0 if son_enteras(filas) else Fraction(0)
+    # Cada fila se guarda como pares (k, valor) no nulos
+    no_nulas = [[(k, x) for k, x in enumerate(fila) if x != 0] for fila in filas]
+    G = [[cero] * n for _ in range(n)]
+    for i in range(n):
+        fila_i, nz_i = filas[i], no_nulas[i]
+        G_i = G[i]
+        for j in range(i, n):
+            fila_j = filas[j]
+            # Se recorren solo las entradas no nulas de la fila más corta
+            if len(no_nulas[j]) < len(nz_i):
+                v = sum((x * fila_i[k] for k, x in no_nulas[j]), cero)
+            else:
+                v = sum((x * fila_j[k] for k, x in nz_i), cero)
+            G_i[j] = v
+            G[j][i] = v
+    return G
+
+
+# =====================================================
+#    POTENCIAS (EXPONENCIACIÓN BINARIA)
+# =====================================================
+# clave (matriz, backend) → [A, A², A⁴, …, A^(2^i)] ya calculadas
+_cache_potencias: "OrderedDict[tuple, list]" = OrderedDict()
+
+
+def limpiar_cache_potencias():
+    _cache_potencias.clear()
+
+
+def _cuadrados(A, hasta, backend):
+    """
+    Lista [A, A², …, A^(2^hasta)] tomada de la caché y completada con los cuadrados
+    que falten. Devuelve (lista, cuántos estaban ya en la caché).
+    """
+    clave = (tuple(tuple(fila) for fila in A), backend)
+    cuadrados = _cache_potencias.get(clave)
+    if cuadrados is None:
+        # Copia propia: si el llamador modifica A después, la caché no cambia
+        cuadrados = [[list(fila) for fila in A]]
+        _cache_potencias[clave] = cuadrados
+    _cache_potencias.move_to_end(clave)
+    while len(_cache_potencias) > MAX_CACHE_POTENCIAS:
+        _cache_potencias.popitem(last=False)
+
+    previos = len(cuadrados)
+    while len(cuadrados) <= hasta:
+        ultimo = cuadrados[-1]
+        cuadrados.append(multiplicar(ultimo, ultimo, backend=backend))
+    return cuadrados, min(previos, hasta + 1)
+
+
+def _identidad(n, backend):
+    uno, cero = (1.0, 0.0) if usa_flotante(backend) else (1, 0)
+    return [[uno if i == j else cero for j in range(n)] for i in range(n)]
+
+
+def potencia(A, k, backend=BACKEND_EXACTO):
+    """
+    A^k (k ≥ 0) por exponenciación binaria: ⌊log₂ k⌋ cuadrados y a lo sumo
+    otros tantos productos. Los cuadrados se reutilizan entre llamadas con la misma A.
+    """
+    if k == 0:
+        return _identidad(len(A), backend)
+    cuadrados, _ = _cuadrados(A, k.bit_length() - 1, backend)
+    resultado = None
+    for i in range(k.bit_length()):
+        if (k >> i) & 1:
+            resultado = cuadrados[i] if resultado is None else multiplicar(resultado, cuadrados[i], backend=backend)
+    # La matriz devuelta no debe compartir filas con la caché
+    return [list(fila) for fila in resultado]
+
+
+# =====================================================
+#    EXPLICACIONES (SOLO CUANDO SE PIDEN)
+# =====================================================
+def _detalle_elemento_a_elemento(A, B, simbolo):
+    expresiones = [
+        [f"{envolver_valor(a)}{simbolo}{envolver_valor(b)}" for a, b in zip(fila_A, fila_B)]
+        for fila_A, fila_B in zip(A, B)
+    ]
+    return formatear_detalle_operacion(expresiones)
+
+
+def _detalle_producto(A, B):
+    cols_B = len(B[0])
+    expresiones = []
+    for fila_A in A:
+        fila_exp = []
+        for j in range(cols_B):
+            sumandos = [f"{envolver_valor(a)}·{envolver_valor(B[k][j])}" for k, a in enumerate(fila_A)]
+            fila_exp.append(f"({' + '.join(sumandos)})")
+        expresiones.append(fila_exp)
+    return formatear_detalle_operacion(expresiones)
+
+
+def _detalle_omitido(terminos):
+    return (
+        f"[Detalle omitido: la operación tiene {terminos} términos "
+        f"(límite de detalle: {LIMITE_DETALLE}).]"
+    )
+
+
+def _agregar_detalle(procedimiento, detalle, terminos, construir):
+    """Añade el bloque 'Detalles de operación' si se pidió y no supera el límite."""
+    if not detalle:
+        return
+    procedimiento.append("Detalles de operación:")
+    if terminos > LIMITE_DETALLE:
+        procedimiento.append(_detalle_omitido(terminos))
+    else:
+        procedimiento.append(construir())
+
+
+
 # =====================================================
 #    SUMA DE MATRICES
 # =====================================================
-def sumar_con_pasos(A_raw, B_raw, escalar_A=None, escalar_B=None):
-    """Suma dos matrices mostrando el procedimiento paso a paso, con soporte para escalares."""
+def sumar_con_pasos(A_raw, B_raw, escalar_A=None, escalar_B=None, detalle=True, backend=None):
+    """
+    Suma dos matrices mostrando el procedimiento paso a paso, con soporte para escalares.
+    Con detalle=False no se genera texto de matrices (ni escaladas ni detalle por celda);
+    con detalle=True el detalle por celda se omite si supera LIMITE_DETALLE.
+    'backend' (None = el global de core.backend_numerico) permite el modo flotante.
+    """
     if len(A_raw) != len(B_raw) or len(A_raw[0]) != len(B_raw[0]):
         return {"error": "Para sumar: A y B deben tener el mismo tamaño."}
 
-    procedimiento_texto, A_esc, B_esc = construir_procedimiento_con_escalares(
-        A_raw, B_raw, escalar_A, escalar_B, "+"
+    procedimiento_texto, alfa, beta, A_esc, B_esc = construir_procedimiento_con_escalares(
+        A_raw, B_raw, escalar_A, escalar_B, "+", detalle
     )
     procedimiento = [procedimiento_texto]
 
-    filas, cols = len(A_esc), len(A_esc[0])
-    expresiones, resultado = [], []
+    resultado = a_fracciones(combinar_escalado(
+        a_numeros(A_raw), a_numeros(B_raw), entero_o_none(alfa), entero_o_none(beta),
+        signo=1, backend=backend_activo(backend)
+    ))
 
-    for i in range(filas):
-        fila_exp, fila_res = [], []
-        for j in range(cols):
-            a_val, b_val = A_esc[i][j], B_esc[i][j]
-            fila_exp.append(f"{envolver_valor(a_val)}+{envolver_valor(b_val)}")
-            fila_res.append(convertir_a_fraccion(a_val) + convertir_a_fraccion(b_val))
-        expresiones.append(fila_exp)
-        resultado.append(fila_res)
-
-    procedimiento.append("Detalles de operación:")
-    procedimiento.append(formatear_detalle_operacion(expresiones))
+    terminos = len(A_raw) * len(A_raw[0])
+    _agregar_detalle(procedimiento, detalle, terminos,
+                     lambda: _detalle_elemento_a_elemento(A_esc, B_esc, "+"))
 
     return {
         "procedimiento": "\n".join(procedimiento),
@@ -48,30 +347,29 @@ def sumar_con_pasos(A_raw, B_raw, escalar_A=None, escalar_B=None):
 # =====================================================
 #    RESTA DE MATRICES
 # =====================================================
-def restar_con_pasos(A_raw, B_raw, escalar_A=None, escalar_B=None):
-    """Resta dos matrices mostrando el procedimiento paso a paso, con soporte para escalares."""
+def restar_con_pasos(A_raw, B_raw, escalar_A=None, escalar_B=None, detalle=True, backend=None):
+    """
+    Resta dos matrices mostrando el procedimiento paso a paso, con soporte para escalares.
+    Con detalle=False no se genera texto de matrices (ni escaladas ni detalle por celda);
+    con detalle=True el detalle por celda se omite si supera LIMITE_DETALLE.
+    'backend' (None = el global de core.backend_numerico) permite el modo flotante.
+    """
     if len(A_raw) != len(B_raw) or len(A_raw[0]) != len(B_raw[0]):
         return {"error": "Para restar: A y B deben tener el mismo tamaño."}
 
-    procedimiento_texto, A_esc, B_esc = construir_procedimiento_con_escalares(
-        A_raw, B_raw, escalar_A, escalar_B, "-"
+    procedimiento_texto, alfa, beta, A_esc, B_esc = construir_procedimiento_con_escalares(
+        A_raw, B_raw, escalar_A, escalar_B, "-", detalle
     )
     procedimiento = [procedimiento_texto]
 
-    filas, cols = len(A_esc), len(A_esc[0])
-    expresiones, resultado = [], []
-
-    for i in range(filas):
-        fila_exp, fila_res = [], []
-        for j in range(cols):
-            a_val, b_val = A_esc[i][j], B_esc[i][j]
-            fila_exp.append(f"{envolver_valor(a_val)}-{envolver_valor(b_val)}")
-            fila_res.append(convertir_a_fraccion(a_val) - convertir_a_fraccion(b_val))
-        expresiones.append(fila_exp)
-        resultado.append(fila_res)
+    resultado = a_fracciones(combinar_escalado(
+        a_numeros(A_raw), a_numeros(B_raw), entero_o_none(alfa), entero_o_none(beta),
+        signo=-1, backend=backend_activo(backend)
+    ))
 
-    procedimiento.append("Detalles de operación:")
-    procedimiento.append(formatear_detalle_operacion(expresiones))
+    terminos = len(A_raw) * len(A_raw[0])
+    _agregar_detalle(procedimiento, detalle, terminos,
+                     lambda: _detalle_elemento_a_elemento(A_esc, B_esc, "-"))
 
     return {
         "procedimiento": "\n".join(procedimiento),
@@ -84,44 +382,244 @@ def restar_con_pasos(A_raw, B_raw, escalar_A=None, escalar_B=None):
 # =====================================================
 #    MULTIPLICACIÓN DE MATRICES
 # =====================================================
-def multiplicar_con_pasos(A_raw, B_raw, escalar_A=None, escalar_B=None):
+def multiplicar_con_pasos(A_raw, B_raw, escalar_A=None, escalar_B=None, detalle=True, metodo="auto",
+                          backend=None):
     """
     Multiplica dos matrices mostrando el procedimiento paso a paso.
     Si hay escalares, se muestran primero los bloques de multiplicación escalar
     antes del encabezado principal y los cálculos detallados.
+    Con detalle=False no se genera texto de matrices (ni escaladas ni detalle por celda);
+    con detalle=True el detalle por celda se omite si supera LIMITE_DETALLE.
+    'metodo' elige el kernel del producto (ver multiplicar).
+    'backend' (None = el global de core.backend_numerico) permite el modo flotante.
+    Con metodo="auto", sin escalares y sin detalle por celda visible, B de una columna
+    usa el kernel matriz–vector y un operando identidad, diagonal o de permutación
+    usa el atajo de core.estructura.
     """
     if len(A_raw[0]) != len(B_raw):
         return {"error": "Para multiplicar: columnas de A deben coincidir con filas de B."}
 
-    procedimiento_texto, A_esc, B_esc = construir_procedimiento_con_escalares(
-        A_raw, B_raw, escalar_A, escalar_B, "×"
+    terminos = len(A_raw) * len(B_raw[0]) * len(A_raw[0])
+    # Los atajos solo se toman si el detalle por celda no se iba a mostrar
+    # (detalle=False o más de LIMITE_DETALLE términos) y el método es "auto"
+    atajo_permitido = (metodo == "auto" and not escalar_A and not escalar_B
+                       and not (detalle and terminos <= LIMITE_DETALLE))
+
+    # B de una sola columna y sin escalares → kernel matriz–vector
+    if atajo_permitido and len(B_raw[0]) == 1:
+        return multiplicar_vector_con_pasos(A_raw, B_raw, detalle=detalle, backend=backend)
+
+    # Identidad, diagonal o permutación → atajo O(n²) sin productos fila·columna
+    if atajo_permitido and not usa_flotante(backend_activo(backend)):
+        atajo = _producto_con_atajo(A_raw, B_raw)
+        if atajo is not None:
+            return atajo
+
+    procedimiento_texto, alfa, beta, A_esc, B_esc = construir_procedimiento_con_escalares(
+        A_raw, B_raw, escalar_A, escalar_B, "×", detalle
     )
     procedimiento = [procedimiento_texto]
 
-    filas_A, cols_A = len(A_esc), len(A_esc[0])
-    filas_B, cols_B = len(B_esc), len(B_esc[0])
+    resultado = a_fracciones(multiplicar_escalado(
+        a_numeros(A_raw), a_numeros(B_raw), entero_o_none(alfa), entero_o_none(beta),
+        metodo, backend_activo(backend)
+    ))
 
-    expresiones, resultado = [], []
+    # ---- Bloque de operaciones ----
+    _agregar_detalle(procedimiento, detalle, terminos, lambda: _detalle_producto(A_esc, B_esc))
 
-    for i in range(filas_A):
-        fila_exp, fila_res = [], []
-        for j in range(cols_B):
-            sumandos = []
-            suma_total = Fraction(0)
-            for k in range(cols_A):
-                a_val, b_val = A_esc[i][k], B_esc[k][j]
-                sumandos.append(f"{envolver_valor(a_val)}·{envolver_valor(b_val)}")
-                suma_total += convertir_a_fraccion(a_val) * convertir_a_fraccion(b_val)
-            fila_exp.append(f"({' + '.join(sumandos)})")
-            fila_res.append(suma_total)
+    # ✅ Nueva sección: mostrar el resultado final con separación visual
+    procedimiento.append("\nResultado:")
+    procedimiento.append(resultado_en_fracciones(resultado))
+
+    return {
+        "procedimiento": "\n".join(procedimiento),
+        "resultado_lista": resultado,
+        "resultado_frac": resultado_en_fracciones(resultado),
+        "resultado_dec": resultado_en_decimales(resultado),
+    }
+
+
+# Explicación de cada atajo: (A especial, B especial)
+_TEXTO_ATAJO = {
+    "identidad": ("I·B = B: el resultado es B sin operar.",
+                  "A·I = A: el resultado es A sin operar."),
+    "diagonal": ("A es diagonal: la fila i de B se multiplica por aᵢᵢ.",
+                 "B es diagonal: la columna j de A se multiplica por bⱼⱼ."),
+    "permutacion": ("A es de permutación: A·B reordena las filas de B.",
+                    "B es de permutación: A·B reordena las columnas de A."),
+}
+
+
+def _producto_con_atajo(A_raw, B_raw):
+    """multiplicar_con_pasos cuando A o B tiene estructura especial; None si no aplica."""
+    A, B = a_numeros(A_raw), a_numeros(B_raw)
+    est_A, est_B = detectar_estructura(A), detectar_estructura(B)
+    resultado = multiplicar_estructurado(A, B, est_A, est_B)
+    if resultado is None:
+        return None
+
+    # multiplicar_estructurado aplica el atajo de A si lo hay; si no, el de B
+    if est_A in _TEXTO_ATAJO:
+        cual, texto = "A", _TEXTO_ATAJO[est_A][0]
+    else:
+        cual, texto = "B", _TEXTO_ATAJO[est_B][1]
+    resultado = a_fracciones(resultado)
+    estructura = est_A if cual == "A" else est_B
+    procedimiento = [
+        f"Operación A × B  ({len(A)}×{len(A[0])} · {len(B)}×{len(B[0])})",
+        f"ATAJO: {cual} es {NOMBRES[estructura]} (detectado en O(n²)).",
+        texto,
+        "\nResultado:",
+        resultado_en_fracciones(resultado),
+    ]
+    return {
+        "procedimiento": "\n".join(procedimiento),
+        "resultado_lista": resultado,
+        "resultado_frac": resultado_en_fracciones(resultado),
+        "resultado_dec": resultado_en_decimales(resultado),
+    }
+
+
+# =====================================================
+#    MATRIZ DE GRAM
+# =====================================================
+def _detalle_gram(filas, simbolo):
+    n = len(filas)
+    expresiones = []
+    for i in range(n):
+        fila_exp = []
+        for j in range(n):
+            if j < i:
+                fila_exp.append(f"(= {simbolo}{j + 1},{i + 1})")
+            else:
+                sumandos = [f"{envolver_valor(a)}·{envolver_valor(b)}" for a, b in zip(filas[i], filas[j])]
+                fila_exp.append(f"({' + '.join(sumandos)})")
         expresiones.append(fila_exp)
-        resultado.append(fila_res)
+    return formatear_detalle_operacion(expresiones)
 
-    # ---- Bloque de operaciones ----
-    procedimiento.append("Detalles de operación:")
-    procedimiento.append(formatear_detalle_operacion(expresiones))
 
-    # ✅ Nueva sección: mostrar el resultado final con separación visual
+def gram_con_pasos(A_raw, transpuesta_primero=False, detalle=True):
+    """
+    Matriz de Gram A·Aᵀ (o Aᵀ·A) aprovechando la simetría.
+    El detalle por celda muestra solo el triángulo superior; el resto se refleja.
+    """
+    nombre = "Aᵀ·A" if transpuesta_primero else "A·Aᵀ"
+    A = a_numeros(A_raw)
+    resultado = a_fracciones(gram(A, transpuesta_primero))
+    n = len(resultado)
+    largo = len(A) if transpuesta_primero else len(A[0])
+
+    procedimiento = [
+        f"Producto de Gram {nombre}  ({n}×{n}, simétrico)",
+        f"Se calculan {n * (n + 1) // 2} de {n * n} entradas (triángulo superior); "
+        "el resto se copia por simetría: gⱼᵢ = gᵢⱼ.",
+    ]
+    terminos = n * (n + 1) // 2 * largo
+    filas = [list(c) for c in zip(*A_raw)] if transpuesta_primero else A_raw
+    _agregar_detalle(procedimiento, detalle, terminos, lambda: _detalle_gram(filas, "g"))
+
+    procedimiento.append("\nResultado:")
+    procedimiento.append(resultado_en_fracciones(resultado))
+
+    return {
+        "procedimiento": "\n".join(procedimiento),
+        "resultado_lista": resultado,
+        "resultado_frac": resultado_en_fracciones(resultado),
+        "resultado_dec": resultado_en_decimales(resultado),
+    }
+
+
+# =====================================================
+#    PRODUCTO MATRIZ–VECTOR
+# =====================================================
+def multiplicar_vector_con_pasos(A_raw, x_raw, detalle=True, filas_mostradas=LIMITE_FILAS_VECTOR, backend=None):
+    """
+    A·x con x vector (plano o matriz columna). No construye la lista de
+    expresiones por celda: con detalle=True solo se explican las primeras
+    'filas_mostradas' filas como «fila i · x».
+    El resultado se devuelve como matriz columna.
+    """
+    x = _como_vector(x_raw)
+    if len(A_raw[0]) != len(x):
+        return {"error": "Para multiplicar: columnas de A deben coincidir con el tamaño de x."}
+
+    A, x_num = a_numeros(A_raw), a_numeros([x])[0]
+    valores = a_fracciones([multiplicar_vector(A, x_num, backend_activo(backend))])[0]
+    resultado = [[v] for v in valores]
+
+    m, n = len(A_raw), len(x)
+    procedimiento = [f"Producto matriz–vector A·x  ({m}×{n} · {n}×1)"]
+    if detalle:
+        mostradas = min(m, filas_mostradas)
+        procedimiento.append("")
+        for i in range(mostradas):
+            sumandos = " + ".join(f"{envolver_valor(a)}·{envolver_valor(b)}" for a, b in zip(A_raw[i], x))
+            procedimiento.append(f"fila {i + 1} · x = {sumandos} = {valores[i]}")
+        if m > mostradas:
+            procedimiento.append(f"[… {m - mostradas} filas más sin detalle]")
+
+    procedimiento.append("\nResultado:")
+    procedimiento.append(resultado_en_fracciones(resultado))
+
+    return {
+        "procedimiento": "\n".join(procedimiento),
+        "resultado_lista": resultado,
+        "resultado_frac": resultado_en_fracciones(resultado),
+        "resultado_dec": resultado_en_decimales(resultado),
+    }
+
+
+# =====================================================
+#    POTENCIA DE UNA MATRIZ
+# =====================================================
+def _nombre_potencia(base, e):
+    return base if e == 1 else f"{base}^{e}"
+
+
+def potencia_con_pasos(A_raw, k, nombre="A", backend=None):
+    """
+    Calcula A^k con exponenciación binaria. Para k < 0 se usa (A⁻¹)^|k|.
+    El procedimiento muestra solo la cadena de cuadrados y los factores que
+    se combinan, no las matrices intermedias.
+    """
+    if len(A_raw) != len(A_raw[0]):
+        return {"error": f"Para calcular potencias: {nombre} debe ser cuadrada."}
+    try:
+        k = int(str(k).strip())
+    except ValueError:
+        return {"error": f"El exponente debe ser un número entero (se recibió {k!r})."}
+
+    backend = backend_activo(backend)
+    A = a_numeros(A_raw)
+    base = nombre
+    procedimiento = [f"Cálculo de {nombre}^{k} por exponenciación binaria"]
+
+    if k < 0:
+        from core.inversa_bloques import inversa_por_bloques
+        inv = inversa_por_bloques(A)
+        if inv is None:
+            return {"error": f"{nombre} no es invertible (determinante = 0): {nombre}^{k} no existe."}
+        A = a_numeros(inv)
+        base = f"{nombre}⁻¹"
+        procedimiento.append(f"{nombre}^{k} = ({base})^{-k}")
+        k = -k
+
+    if k == 0:
+        procedimiento.append(f"{nombre}^0 = I (identidad de orden {len(A)})")
+    else:
+        cuadrados, en_cache = _cuadrados(A, k.bit_length() - 1, backend)
+        procedimiento.append(f"{k} = {bin(k)[2:]}₂  →  cuadrados: {k.bit_length() - 1}, "
+                             f"productos: {bin(k).count('1') - 1}")
+        procedimiento.append("\nCadena de cuadrados:")
+        for i in range(1, k.bit_length()):
+            anterior = _nombre_potencia(base, 2 ** (i - 1))
+            origen = "  (tomado de la caché)" if i < en_cache else ""
+            procedimiento.append(f"{_nombre_potencia(base, 2 ** i)} = {anterior}·{anterior}{origen}")
+        factores = [_nombre_potencia(base, 2 ** i) for i in range(k.bit_length()) if (k >> i) & 1]
+        procedimiento.append(f"\n{_nombre_potencia(base, k)} = {'·'.join(factores)}")
+
+    resultado = a_fracciones(potencia(A, k, backend))
     procedimiento.append("\nResultado:")
     procedimiento.append(resultado_en_fracciones(resultado))
 
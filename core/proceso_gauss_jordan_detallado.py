@@ -3,11 +3,34 @@ from fractions import Fraction
 from soporte.formato_matrices import formatear_matriz, matriz_alineada_con_titulo
 
 
+# =====================================================
+#   KERNELS DE FILA (IN-PLACE)
+# =====================================================
+
+def _normalizar_fila(fila, pivote, desde):
+    """F ← F / pivote, modificando la fila en su lugar desde la columna 'desde'."""
+    for c in range(desde, len(fila)):
+        if fila[c] != 0:
+            fila[c] /= pivote
+
+
+def _eliminar_fila(fila, fila_pivote, factor, desde):
+    """F ← F − factor·Fp en su lugar; solo columnas activas (≥ desde) con Fp[c] ≠ 0."""
+    for c in range(desde, len(fila)):
+        valor = fila_pivote[c]
+        if valor != 0:
+            fila[c] -= factor * valor
+
+
 def proceso_gauss_jordan_detallado(A):
     """
     Ejecuta el método de Gauss–Jordan mostrando los pasos al estilo 'Matrix Calculator'.
     Se usa principalmente para el cálculo de la inversa o para mostrar la eliminación por filas.
     Si la matriz no es invertible, muestra los pasos hasta detectarlo.
+
+    Devuelve (texto, inversa | None, info), donde info registra los subproductos
+    de la eliminación: {"det", "rango", "pivotes", "permutaciones"}.
+    det(A) = (−1)^permutaciones · ∏ pivotes  (0 si alguna columna queda sin pivote).
     """
 
     n = len(A)
@@ -20,66 +43,86 @@ def proceso_gauss_jordan_detallado(A):
     pasos.append("Matriz aumentada inicial:")
     pasos.append(matriz_alineada_con_titulo("[A | I]", Aum, con_barra=False))
 
+    # Columnas a la izquierda del pivote ya son cero en la fila pivote,
+    # salvo las columnas libres: desde ahí empieza la parte activa.
+    primera_libre = None
+
+    # Subproductos para det(A) y rango(A)
+    fila_pivote = 0
+    pivotes = []
+    permutaciones = 0
+
     # ===== INICIO DEL PROCESO =====
     for col in range(n):
         pasos.append(f"\n>>> Columna {col+1}")
 
         # Buscar pivote
         pivote_fila = None
-        for f in range(col, n):
+        for f in range(fila_pivote, n):
             if Aum[f][col] != 0:
                 pivote_fila = f
                 break
 
         if pivote_fila is None:
             pasos.append(f"→ No se encontró pivote en la columna {col+1}. Columna libre.\n")
+            if primera_libre is None:
+                primera_libre = col
             continue
 
         pivote = Aum[pivote_fila][col]
         pasos.append(f"Pivote encontrado en F{pivote_fila+1}, C{col+1}: {pivote}")
 
         # Intercambiar filas si el pivote no está en la posición esperada
-        if pivote_fila != col:
-            Aum[col], Aum[pivote_fila] = Aum[pivote_fila], Aum[col]
-            pasos.append(f"\nPermutar filas: F{col+1} ↔ F{pivote_fila+1}")
+        if pivote_fila != fila_pivote:
+            Aum[fila_pivote], Aum[pivote_fila] = Aum[pivote_fila], Aum[fila_pivote]
+            permutaciones += 1
+            pasos.append(f"\nPermutar filas: F{fila_pivote+1} ↔ F{pivote_fila+1}")
             pasos.append(formatear_matriz(Aum, corchetes=True))
 
+        desde = col if primera_libre is None else primera_libre
+
         # Normalizar la fila del pivote
-        pivote = Aum[col][col]
+        pivote = Aum[fila_pivote][col]
+        pivotes.append(pivote)
         if pivote != 1:
-            pasos.append(f"\nF{col+1} / ({pivote}) → F{col+1}")
-            Aum[col] = [x / pivote for x in Aum[col]]
+            pasos.append(f"\nF{fila_pivote+1} / ({pivote}) → F{fila_pivote+1}")
+            _normalizar_fila(Aum[fila_pivote], pivote, desde)
             pasos.append(formatear_matriz(Aum, corchetes=True))
 
         # Eliminar otras filas en la columna
         for r in range(n):
-            if r == col:
+            if r == fila_pivote:
                 continue
             factor = Aum[r][col]
             if factor == 0:
                 continue
             signo = "-" if factor > 0 else "+"
-            pasos.append(f"\nF{r+1} {signo} {abs(factor)}·F{col+1} → F{r+1}")
-            Aum[r] = [Aum[r][c] - factor * Aum[col][c] for c in range(2 * n)]
+            pasos.append(f"\nF{r+1} {signo} {abs(factor)}·F{fila_pivote+1} → F{r+1}")
+            _eliminar_fila(Aum[r], Aum[fila_pivote], factor, desde)
             pasos.append(formatear_matriz(Aum, corchetes=True))
 
+        fila_pivote += 1
+
+    # ===== SUBPRODUCTOS: DETERMINANTE Y RANGO =====
+    rango = len(pivotes)
+    det = Fraction(0)
+    if rango == n:
+        det = Fraction(-1 if permutaciones % 2 else 1)
+        for p in pivotes:
+            det *= p
+    info = {"det": det, "rango": rango, "pivotes": pivotes, "permutaciones": permutaciones}
+
     # ===== RESULTADO FINAL =====
-    izquierda = [fila[:n] for fila in Aum]
     derecha = [fila[n:] for fila in Aum]
 
-    # Verificar si la parte izquierda es la identidad
-    es_identidad = all(
-        all((izquierda[i][j] == 1 if i == j else izquierda[i][j] == 0) for j in range(n))
-        for i in range(n)
-    )
-
     pasos.append("\nMatriz final obtenida:")
     pasos.append(matriz_alineada_con_titulo("[A | I]", Aum, con_barra=False))
 
-    if es_identidad:
+    # La parte izquierda es la identidad exactamente cuando hay pivote en cada columna
+    if rango == n:
         # No imprimir conclusión aquí; se mostrará en el resultado final
-        return "\n".join(pasos), derecha
+        return "\n".join(pasos), derecha, info
     else:
         pasos.append("Durante el proceso, se detectó que A no puede transformarse en la identidad.")
         pasos.append("Por tanto, A es singular (no invertible).")
-        return "\n".join(pasos), None
+        return "\n".join(pasos), None, info
@@ -0,0 +1,251 @@
+# core/rango_modular.py
+import random
+from fractions import Fraction
+from typing import List, Any, Dict, Optional
+from soporte.formato_matrices import convertir_a_fraccion
+
+# Primos aleatorios de 61 bits generados una vez por proceso
+BITS_PRIMO = 61
+_primos: List[int] = []
+
+# =====================================================
+#   PRIMOS ALEATORIOS
+# =====================================================
+
+# Con estas bases Miller–Rabin es determinista para n < 3.3·10²⁴
+_BASES_MR = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def _es_primo(n: int) -> bool:
+    if n < 2:
+        return False
+    for p in _BASES_MR:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _BASES_MR:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def primo_aleatorio(bits: int = BITS_PRIMO, rnd: Optional[random.Random] = None) -> int:
+    """Devuelve un primo aleatorio de exactamente 'bits' bits."""
+    rnd = rnd or random
+    while True:
+        candidato = rnd.getrandbits(bits) | (1 << (bits - 1)) | 1
+        if _es_primo(candidato):
+            return candidato
+
+
+def primos_de_trabajo(cantidad: int = 2) -> List[int]:
+    """Primos aleatorios de 61 bits reutilizados durante toda la sesión."""
+    while len(_primos) < cantidad:
+        p = primo_aleatorio()
+        if p not in _primos:
+            _primos.append(p)
+    return _primos[:cantidad]
+
+
+# =====================================================
+#   RANGO MÓDULO p (ARITMÉTICA ENTERA)
+# =====================================================
+
+def _reducir_mod(valor: Any, p: int) -> Optional[int]:
+    """a/b ↦ a·b⁻¹ (mod p). None si p divide al denominador."""
+    x = valor if isinstance(valor, (int, Fraction)) else convertir_a_fraccion(valor)
+    if isinstance(x, int):
+        return x % p
+    den = x.denominator % p
+    if den == 0:
+        return None
+    return x.numerator * pow(den, -1, p) % p
+
+
+def rango_mod_p(M: List[List[Any]], p: int) -> Optional[int]:
+    """
+    Rango de M sobre el cuerpo Z/pZ con eliminación de Gauss en enteros.
+    Siempre rango_p(M) ≤ rango(M); devuelve None si M no se puede reducir módulo p.
+    """
+    filas = []
+    for fila in M:
+        reducida = [_reducir_mod(x, p) for x in fila]
+        if None in reducida:
+            return None
+        filas.append(reducida)
+    if not filas:
+        return 0
+
+    n_filas, n_cols = len(filas), len(filas[0])
+    rango = 0
+    for col in range(n_cols):
+        if rango == n_filas:
+            break
+        piv = next((f for f in range(rango, n_filas) if filas[f][col]), None)
+        if piv is None:
+            continue
+        filas[rango], filas[piv] = filas[piv], filas[rango]
+        fila_piv = filas[rango]
+        inv = pow(fila_piv[col], -1, p)
+        cola_piv = fila_piv[col:]
+        for r in range(rango + 1, n_filas):
+            fila = filas[r]
+            factor = fila[col] * inv % p
+            if factor:
+                fila[col:] = [(x - factor * y) % p for x, y in zip(fila[col:], cola_piv)]
+        rango += 1
+    return rango
+
+
+def rango_modular(M: List[List[Any]], intentos: int = 2) -> Dict[str, Any]:
+    """
+    Rango de M (entradas racionales) con eliminación módulo primos aleatorios de 61 bits:
+    O(filas·cols·r) operaciones sobre enteros de tamaño de palabra.
+    - rango_p(M) ≤ rango(M) siempre: si algún primo da rango completo, el resultado es exacto.
+    - Si el primero muestra deficiencia se prueba un segundo primo; que un primo
+      aleatorio dé una deficiencia falsa ocurre con probabilidad < r·log₂(‖M‖·r)/2⁶⁰.
+    - Solo cuando la respuesta es «deficiente» (dependiente) se calcula el rango exacto
+      (Bareiss en enteros), así que el valor devuelto nunca es erróneo.
+    Devuelve {"rango", "exacto_por": "modular" | "bareiss", "primos_usados", "reporte"}.
+    """
+    completo = min(len(M), len(M[0])) if M else 0
+    mejor, usados = 0, 0
+    for p in primos_de_trabajo(intentos):
+        usados += 1
+        r = rango_mod_p(M, p)
+        if r is None:
+            continue
+        mejor = max(mejor, r)
+        if mejor == completo:
+            return {
+                "rango": mejor,
+                "exacto_por": "modular",
+                "primos_usados": usados,
+                "reporte": (
+                    f"Rango calculado módulo {usados} primo(s) aleatorio(s) de {BITS_PRIMO} bits: "
+                    f"rango completo ({mejor}), resultado exacto."
+                ),
+            }
+
+    from core.enteros import rango_bareiss, filas_a_enteros
+    exacto = rango_bareiss(filas_a_enteros(M))
+    return {
+        "rango": exacto,
+        "exacto_por": "bareiss",
+        "primos_usados": usados,
+        "reporte": (
+            f"Módulo {usados} primos de {BITS_PRIMO} bits el rango fue {mejor} < {completo}; "
+            f"certificado exacto (eliminación libre de fracciones): rango = {exacto}."
+        ),
+    }
+
+
+def es_singular_probable(A: List[List[Any]], intentos: int = 2) -> bool:
+    """
+    Pre-chequeo barato de singularidad para A cuadrada.
+    - Si algún primo da rango n, A es invertible con certeza (el rango módulo p nunca supera al real).
+    - Si todos los primos dan rango < n, A es singular salvo que p divida a det(A),
+      lo que ocurre con probabilidad < n/2⁶⁰ por primo.
+    """
+    n = len(A)
+    for p in primos_de_trabajo(intentos):
+        r = rango_mod_p(A, p)
+        if r is not None and r == n:
+            return False
+    return True
+
+
+# =====================================================
+#   CERTIFICADO EXACTO DE DEFICIENCIA DE RANGO
+# =====================================================
+
+def rref_exacta(M: List[List[Any]]):
+    """RREF exacta en Fraction, sin texto. Devuelve (rref, columnas_pivote)."""
+    m = [[convertir_a_fraccion(x) for x in fila] for fila in M]
+    n_filas, n_cols = len(m), len(m[0]) if m else 0
+    columnas_pivote: List[int] = []
+    fila_pivote = 0
+    for col in range(n_cols):
+        if fila_pivote == n_filas:
+            break
+        piv = next((f for f in range(fila_pivote, n_filas) if m[f][col] != 0), None)
+        if piv is None:
+            continue
+        m[fila_pivote], m[piv] = m[piv], m[fila_pivote]
+        fila_piv = m[fila_pivote]
+        pivote = fila_piv[col]
+        if pivote != 1:
+            for c in range(col, n_cols):
+                fila_piv[c] /= pivote
+        for r in range(n_filas):
+            if r == fila_pivote:
+                continue
+            factor = m[r][col]
+            if factor != 0:
+                fila = m[r]
+                for c in range(col, n_cols):
+                    if fila_piv[c] != 0:
+                        fila[c] -= factor * fila_piv[c]
+        columnas_pivote.append(col)
+        fila_pivote += 1
+    return m, columnas_pivote
+
+
+def base_espacio_nulo(rref, columnas_pivote: List[int], n_cols: int) -> List[List[Fraction]]:
+    """
+    Base del espacio nulo leída directamente de la RREF, sin volver a resolver:
+    por cada columna libre f, x_f = 1, las demás libres en 0 y x_pivote = −rref[i][f].
+    """
+    pivotes = set(columnas_pivote)
+    base = []
+    for f in range(n_cols):
+        if f in pivotes:
+            continue
+        x = [Fraction(0)] * n_cols
+        x[f] = Fraction(1)
+        for i, col in enumerate(columnas_pivote):
+            x[col] = -rref[i][f]
+        base.append(x)
+    return base
+
+
+def certificado_singularidad(A: List[List[Any]]) -> Dict[str, Any]:
+    """
+    Rango exacto de A y, si hay deficiencia de rango, un vector x ≠ 0 con A·x = 0.
+    Devuelve {"rango", "columnas_pivote", "vector_nulo" (None si no hay), "reporte"}.
+    """
+    rref, pivotes = rref_exacta(A)
+    n_cols = len(A[0]) if A else 0
+    rango = len(pivotes)
+    libres = [j for j in range(n_cols) if j not in pivotes]
+
+    reporte = ["CERTIFICADO DE DEFICIENCIA DE RANGO:"]
+    if not libres:
+        reporte.append(f"rango(A) = {rango}: no hay columnas libres, A·x = 0 solo admite x = 0.")
+        return {"rango": rango, "columnas_pivote": pivotes, "vector_nulo": None, "reporte": "\n".join(reporte)}
+
+    # Variable libre x_f = 1, las demás libres en 0 y las pivote despejadas de la RREF
+    f = libres[0]
+    x = base_espacio_nulo(rref, pivotes, n_cols)[0]
+
+    # Comprobación explícita del certificado
+    A_fr = [[convertir_a_fraccion(v) for v in fila] for fila in A]
+    if any(sum((a * xj for a, xj in zip(fila, x)), Fraction(0)) != 0 for fila in A_fr):
+        raise ArithmeticError("El vector nulo calculado no satisface A·x = 0.")
+
+    reporte.append(f"Columnas pivote: {', '.join(f'C{c+1}' for c in pivotes) or 'ninguna'}")
+    reporte.append(f"rango(A) = {rango} < {n_cols} → la columna C{f+1} es libre.")
+    reporte.append(f"Tomando x{f+1} = 1 y despejando las variables pivote:")
+    reporte.append("x = [" + ", ".join(str(v) for v in x) + "]")
+    reporte.append("Se verifica A·x = 0 con x ≠ 0, por lo que las columnas de A son linealmente dependientes.")
+    return {"rango": rango, "columnas_pivote": pivotes, "vector_nulo": x, "reporte": "\n".join(reporte)}
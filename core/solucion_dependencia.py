@@ -1,12 +1,27 @@
+from fractions import Fraction
+from functools import lru_cache
 from soporte.formato_matrices import formatear_matriz, matriz_alineada_con_titulo
 from soporte.formato_vectores import formatear_vector, formatear_ecuaciones, formatear_matriz_aumentada
+from core.dependencia_vector import primer_par_multiplo
+from core.enteros import rango_bareiss, filas_a_enteros
+from core.rango_modular import rango_modular, rref_exacta, base_espacio_nulo
 
 TOL = 1e-8
 
+# A partir de este número de entradas (vectores × dimensión) el rango exacto
+# se obtiene módulo primos aleatorios (core.rango_modular)
+UMBRAL_RANGO_MODULAR = 5_000
+
+# Conjuntos de vectores cuyo espacio nulo se conserva
+MAX_CACHE_NULO = 32
+
 # =====================================================
 #   FUNCIONES AUXILIARES
 # =====================================================
 def es_cero(valor, tol=TOL):
+    # int/Fraction se comparan exactamente; la tolerancia solo aplica a float
+    if isinstance(valor, (int, Fraction)):
+        return valor == 0
     return abs(valor) < tol
 
 def es_vector_cero(vector, tol=TOL):
@@ -15,6 +30,12 @@ def es_vector_cero(vector, tol=TOL):
 def copiar_matriz(A):
     return [fila[:] for fila in A]
 
+def texto_numero(x):
+    """Exacto para int/Fraction (2/3); float con 4 cifras significativas."""
+    if isinstance(x, (int, Fraction)):
+        return str(x)
+    return f"{x:.4g}"
+
 # =====================================================
 #   GAUSS–JORDAN
 # =====================================================
@@ -48,9 +69,9 @@ def aplicar_gauss_jordan(A):
 
         # Normalizar pivote
         pivote_valor = M[fila_pivote][col]
-        if not es_cero(pivote_valor - 1.0):
+        if not es_cero(pivote_valor - 1):
             M[fila_pivote] = [x / pivote_valor for x in M[fila_pivote]]
-            pasos.append(f"F{fila_pivote+1} ÷ {pivote_valor:.4g}")
+            pasos.append(f"F{fila_pivote+1} ÷ {texto_numero(pivote_valor)}")
             pasos.append(formatear_matriz(M, corchetes=True))
 
         # Eliminar en otras filas
@@ -58,7 +79,7 @@ def aplicar_gauss_jordan(A):
             if i != fila_pivote and not es_cero(M[i][col]):
                 factor = M[i][col]
                 M[i] = [x - factor * y for x, y in zip(M[i], M[fila_pivote])]
-                pasos.append(f"F{i+1} ← F{i+1} - ({factor:.4g})·F{fila_pivote+1}")
+                pasos.append(f"F{i+1} ← F{i+1} - ({texto_numero(factor)})·F{fila_pivote+1}")
                 pasos.append(formatear_matriz(M, corchetes=True))
 
         fila_pivote += 1
@@ -69,19 +90,115 @@ def aplicar_gauss_jordan(A):
     pasos.append(formatear_matriz(M, corchetes=True))
     return M, pasos
 
+def _rref_flotante(A, tol=TOL, solo_rango=False):
+    """
+    Eliminación con tolerancia, sin texto: pivoteo parcial y filas por debajo de tol
+    descartadas; termina cuando no quedan filas activas. Devuelve (rref, columnas_pivote).
+    Con solo_rango=True no se normaliza ni se elimina hacia arriba (rref = []);
+    las decisiones de pivote son las mismas, así que el rango coincide.
+    """
+    activas = [list(f) for f in A if not es_vector_cero(f, tol)]
+    reducidas, pivotes = [], []
+    for col in range(len(activas[0]) if activas else 0):
+        piv = max(range(len(activas)), key=lambda i: abs(activas[i][col]), default=None)
+        if piv is None or es_cero(activas[piv][col], tol):
+            continue
+        fila_p = activas.pop(piv)
+        p = fila_p[col]
+        nuevas = []
+        for fila in activas:
+            factor = fila[col] / p
+            if factor != 0:
+                fila = [x - factor * y for x, y in zip(fila, fila_p)]
+            if not es_vector_cero(fila, tol):
+                nuevas.append(fila)
+        activas = nuevas
+        pivotes.append(col)
+        if not solo_rango:
+            fila_p = [x / p for x in fila_p]
+            for fila in reducidas:
+                factor = fila[col]
+                if factor != 0:
+                    fila[:] = [x - factor * y for x, y in zip(fila, fila_p)]
+            reducidas.append(fila_p)
+        if not activas:
+            break
+    return reducidas, pivotes
+
+
+def _rango_flotante(A, tol=TOL):
+    return len(_rref_flotante(A, tol, solo_rango=True)[1])
+
+
+def _es_racional(A):
+    return all(isinstance(x, (int, Fraction)) for fila in A for x in fila)
+
+
 def rango_matriz(A):
-    copia = copiar_matriz(A)
-    M, _ = aplicar_gauss_jordan(copia)
-    return sum(not es_vector_cero(f) for f in M)
+    """
+    Rango sin generar pasos. Con entradas racionales (int/Fraction) es exacto:
+    cada fila se lleva a enteros y se elimina libre de fracciones (Bareiss).
+    Con float se usa eliminación con tolerancia TOL.
+    """
+    if _es_racional(A):
+        return rango_bareiss(filas_a_enteros(A))
+    return _rango_flotante(A)
+
+# =====================================================
+#   COEFICIENTES DE DEPENDENCIA (ESPACIO NULO)
+# =====================================================
+@lru_cache(maxsize=MAX_CACHE_NULO)
+def _espacio_nulo(clave):
+    n = len(clave)
+    A = [[clave[j][i] for j in range(n)] for i in range(len(clave[0]))]
+    if _es_racional(clave):
+        rref, pivotes = rref_exacta(A)
+    else:
+        rref, pivotes = _rref_flotante(A)
+    return tuple(tuple(x) for x in base_espacio_nulo(rref, pivotes, n))
+
+
+def espacio_nulo(vectores):
+    """
+    Base de {c : c₁v₁ + … + cₙvₙ = 0}, leída de la RREF de A = [v₁ … vₙ].
+    Exacta con entradas int/Fraction; con float sale de la misma eliminación con
+    tolerancia TOL que da el rango. Vacía si no hay variables libres. Se guarda en
+    caché por conjunto de vectores: el análisis y cualquier exportación la reutilizan.
+    """
+    if not vectores:
+        return []
+    clave = tuple(tuple(v) for v in vectores)
+    return [list(c) for c in _espacio_nulo(clave)]
+
+
+def texto_espacio_nulo(base):
+    """Una línea por vector c de la base: c = (c₁, …, cₙ)."""
+    return [f"c = ({', '.join(texto_numero(x) for x in c)})" for c in base]
+
 
 # =====================================================
 #   ANÁLISIS PRINCIPAL
 # =====================================================
-def analizar_independencia(vectores):
+def analizar_independencia(vectores, base=None):
     """
     Determina si los vectores son linealmente dependientes o independientes.
     Retorna un diccionario con: conclusión, razonamiento y criterio algebraico.
+    Si el conjunto es dependiente incluye "espacio_nulo": base de los coeficientes c
+    con Σ cⱼ·vⱼ = 0 (ver espacio_nulo, que la guarda en caché). Con float la clave
+    se omite si la eliminación con tolerancia no encuentra variables libres (p. ej.
+    cuando la dependencia se detectó por la regla de múltiplos, con otra tolerancia).
+    'base' (core.base_incremental.BaseEscalonada ya sincronizada con 'vectores')
+    evita recalcular el rango desde cero.
     """
+    resultado = _clasificar(vectores, base)
+    if not resultado["independiente"]:
+        base_nula = espacio_nulo(vectores)
+        if base_nula:
+            resultado["espacio_nulo"] = base_nula
+    return resultado
+
+
+def _clasificar(vectores, base):
     if not vectores:
         return {
             "independiente": True,
@@ -113,49 +230,40 @@ def analizar_independencia(vectores):
             "criterio": "Criterio algebraico → sistema con más incógnitas que ecuaciones, variables libres → dependencia."
         }
 
-    # Múltiplos escalares (comparación par a par)
-    for i in range(len(vectores)):
-        for j in range(i + 1, len(vectores)):
-            vi, vj = vectores[i], vectores[j]
-            cociente = None
-            multiples = True
-
-            for a, b in zip(vi, vj):
-                if es_cero(a) and es_cero(b):
-                    continue  # ambos ceros: siguen siendo proporcionales
-                elif es_cero(a) or es_cero(b):
-                    multiples = False
-                    break  # uno es cero y el otro no → no múltiplos
-                else:
-                    ratio = b / a
-                    if cociente is None:
-                        cociente = ratio
-                    elif abs(ratio - cociente) > 1e-6:
-                        multiples = False
-                        break
-
-            if multiples and cociente is not None:
-                # Mostrar limpio sin .0
-                if abs(cociente - round(cociente)) < 1e-6:
-                    multiplo_str = str(int(round(cociente)))
-                else:
-                    multiplo_str = f"{cociente:.2f}"
-
-                return {
-                    "independiente": False,
-                    "regla": "multiplo_escalar",
-                    "conclusion": "Conjunto DEPENDIENTE",
-                    "razonamiento": (
-                        f"v{j+1} = {multiplo_str}·v{i+1} → "
-                        "Si un vector es múltiplo escalar de otro, el conjunto es dependiente."
-                    ),
-                    "criterio": "Criterio algebraico → combinación no trivial: una fila depende de otra."
-                }
+    # Múltiplos escalares: agrupación por dirección canónica, O(n·d)
+    par = primer_par_multiplo(vectores, TOL, paso=1e-6)
+    if par is not None:
+        i, j, cociente = par
+        # Mostrar limpio sin .0 (con entradas exactas el cociente es una Fraction)
+        if isinstance(cociente, Fraction):
+            multiplo_str = str(cociente)
+        elif abs(cociente - round(cociente)) < 1e-6:
+            multiplo_str = str(int(round(cociente)))
+        else:
+            multiplo_str = f"{float(cociente):.2f}"
+
+        return {
+            "independiente": False,
+            "regla": "multiplo_escalar",
+            "conclusion": "Conjunto DEPENDIENTE",
+            "razonamiento": (
+                f"v{j+1} = {multiplo_str}·v{i+1} → "
+                "Si un vector es múltiplo escalar de otro, el conjunto es dependiente."
+            ),
+            "criterio": "Criterio algebraico → combinación no trivial: una fila depende de otra."
+        }
 
     # Sistema homogéneo A·c = 0
-    A_cols = list(zip(*vectores))
-    matriz = [list(f) + [0] for f in A_cols]
-    rango = rango_matriz(matriz)
+    # La columna de ceros de [A | 0] no cambia el rango: basta A (vectores como columnas)
+    nota_rango = ""
+    if base is not None:
+        rango = base.rango
+    elif _es_racional(vectores) and len(vectores) * dimension >= UMBRAL_RANGO_MODULAR:
+        info_rango = rango_modular([list(c) for c in zip(*vectores)])
+        rango = info_rango["rango"]
+        nota_rango = f" [{info_rango['reporte']}]"
+    else:
+        rango = rango_matriz([list(c) for c in zip(*vectores)])
     num_vectores = len(vectores)
 
     # Evaluación algebraica
@@ -165,7 +273,7 @@ def analizar_independencia(vectores):
             "regla": "criterio_algebraico_trivial",
             "conclusion": "Conjunto INDEPENDIENTE",
             "razonamiento": "No hay relaciones lineales entre los vectores.",
-            "criterio": "Criterio algebraico → No hay variables libres, única solución trivial (c = 0)."
+            "criterio": "Criterio algebraico → No hay variables libres, única solución trivial (c = 0)." + nota_rango
         }
     else:
         return {
@@ -173,7 +281,7 @@ def analizar_independencia(vectores):
             "regla": "Combinacion_lineal",
             "conclusion": "Conjunto DEPENDIENTE",
             "razonamiento": "Existen combinaciones no triviales entre los vectores.",
-            "criterio": "Criterio algebraico → Hay variables libres, infinitas soluciones → combinación no trivial (dependencia), un vector es la combinacion lineal de otro."
+            "criterio": "Criterio algebraico → Hay variables libres, infinitas soluciones → combinación no trivial (dependencia), un vector es la combinacion lineal de otro." + nota_rango
         }
 
 # =====================================================
@@ -228,7 +336,7 @@ def generar_proceso_algebraico(vectores):
     # CONCLUSIÓN
     # ============================================
     identidad = all(
-        len(M_final) > i and len(M_final[0]) > i and abs(M_final[i][i] - 1.0) < TOL
+        len(M_final) > i and len(M_final[0]) > i and es_cero(M_final[i][i] - 1)
         for i in range(min(len(M_final), len(M_final[0]) - 1))
     )
 
@@ -0,0 +1,121 @@
+# core/strassen.py
+from fractions import Fraction
+from typing import List, Any, Optional
+from core.enteros import son_enteras
+
+# Hasta este tamaño (mínima dimensión de los bloques) se usa el triple bucle.
+# Ver benchmarks/bench_strassen.py: con Fraction un nivel de recursión ya gana
+# ~1.2–1.3× desde n ≈ 48; con int el bucle clásico es igual o más rápido hasta n ≈ 200.
+CORTE_STRASSEN = 40
+CORTE_STRASSEN_ENTEROS = 256
+
+# =====================================================
+#   OPERACIONES DE BLOQUE
+# =====================================================
+
+def _sumar(A, B):
+    return [[a + b for a, b in zip(fa, fb)] for fa, fb in zip(A, B)]
+
+
+def _restar(A, B):
+    return [[a - b for a, b in zip(fa, fb)] for fa, fb in zip(A, B)]
+
+
+def _producto_clasico(A, B, cero):
+    """Triple bucle i-k-j saltando ceros (caso base de la recursión)."""
+    cols_B = len(B[0])
+    resultado = []
+    for fila_A in A:
+        fila_res = [cero] * cols_B
+        for k, a in enumerate(fila_A):
+            if a == 0:
+                continue
+            fila_B = B[k]
+            for j in range(cols_B):
+                b = fila_B[j]
+                if b != 0:
+                    fila_res[j] += a * b
+        resultado.append(fila_res)
+    return resultado
+
+
+def _rellenar(M, filas, cols, cero):
+    """Completa M con ceros hasta filas × cols (solo si hace falta)."""
+    if len(M) == filas and len(M[0]) == cols:
+        return M
+    extra = cols - len(M[0])
+    relleno = [fila + [cero] * extra for fila in M]
+    relleno.extend([cero] * cols for _ in range(filas - len(M)))
+    return relleno
+
+
+def _cuadrantes(M, f, c):
+    return (
+        [fila[:c] for fila in M[:f]], [fila[c:] for fila in M[:f]],
+        [fila[:c] for fila in M[f:]], [fila[c:] for fila in M[f:]],
+    )
+
+
+# =====================================================
+#   STRASSEN–WINOGRAD (7 productos, 15 sumas)
+# =====================================================
+
+def _strassen(A, B, corte, cero):
+    m, k, n = len(A), len(B), len(B[0])
+    if min(m, k, n) <= corte:
+        return _producto_clasico(A, B, cero)
+
+    # Dimensiones impares: se rellenan con una fila/columna de ceros
+    m2, k2, n2 = m + m % 2, k + k % 2, n + n % 2
+    A_r = _rellenar(A, m2, k2, cero)
+    B_r = _rellenar(B, k2, n2, cero)
+
+    A11, A12, A21, A22 = _cuadrantes(A_r, m2 // 2, k2 // 2)
+    B11, B12, B21, B22 = _cuadrantes(B_r, k2 // 2, n2 // 2)
+
+    S1 = _sumar(A21, A22)
+    S2 = _restar(S1, A11)
+    S3 = _restar(A11, A21)
+    S4 = _restar(A12, S2)
+    T1 = _restar(B12, B11)
+    T2 = _restar(B22, T1)
+    T3 = _restar(B22, B12)
+    T4 = _restar(T2, B21)
+
+    P1 = _strassen(A11, B11, corte, cero)
+    P2 = _strassen(A12, B21, corte, cero)
+    P3 = _strassen(S4, B22, corte, cero)
+    P4 = _strassen(A22, T4, corte, cero)
+    P5 = _strassen(S1, T1, corte, cero)
+    P6 = _strassen(S2, T2, corte, cero)
+    P7 = _strassen(S3, T3, corte, cero)
+
+    U2 = _sumar(P1, P6)
+    U3 = _sumar(U2, P7)
+    U4 = _sumar(U2, P5)
+    C11 = _sumar(P1, P2)
+    C12 = _sumar(U4, P3)
+    C21 = _restar(U3, P4)
+    C22 = _sumar(U3, P5)
+
+    C = [f1 + f2 for f1, f2 in zip(C11, C12)] + [f1 + f2 for f1, f2 in zip(C21, C22)]
+    # Quitar el relleno
+    return [fila[:n] for fila in C[:m]]
+
+
+def corte_para(A, B) -> int:
+    """Corte afinado según el tipo de las entradas."""
+    return CORTE_STRASSEN_ENTEROS if son_enteras(A, B) else CORTE_STRASSEN
+
+
+def multiplicar_strassen(A: List[List[Any]], B: List[List[Any]], corte: Optional[int] = None):
+    """
+    Producto exacto A·B con el esquema recursivo de Strassen–Winograd.
+    Funciona con Fraction o con int (si ambas matrices son enteras el resultado es entero).
+    Sin corte explícito se usa el afinado para el tipo de las entradas.
+    """
+    enteras = son_enteras(A, B)
+    cero = 0 if enteras else Fraction(0)
+    if corte is None:
+        corte = CORTE_STRASSEN_ENTEROS if enteras else CORTE_STRASSEN
+    return _strassen(A, B, max(1, corte), cero)
@@ -3,7 +3,10 @@ from fractions import Fraction
 from tkinter import ttk, messagebox
 from soporte.helpers import preparar_ventana
 from soporte.formato_vectores import formatear_combinacion_lineal
-from core.solucion_dependencia import analizar_independencia
+from core.solucion_dependencia import analizar_independencia, texto_espacio_nulo
+from core.rango_modular import base_espacio_nulo
+from core.base_incremental import BaseEscalonada, texto_combinacion, consultar_generado
+from soporte.formato_matrices import convertir_a_fraccion
 from soporte.formato_matrices import matriz_alineada_con_titulo
 from core.gauss_jordan import clasificar_y_resolver_gauss_jordan
 from ui.estilos import (
@@ -31,6 +34,10 @@ class AppIndependenciaLineal(tk.Toplevel):
         self.numero_vectores = tk.IntVar(value=3)
         self.entradas = []
 
+        # Base escalonada que se conserva entre verificaciones (solo se reducen los vectores nuevos)
+        self._base = BaseEscalonada()
+        self._info_base = []
+
         self._construir_ui()
         self._crear_tabla()
 
@@ -108,6 +115,16 @@ class AppIndependenciaLineal(tk.Toplevel):
         tk.Button(fila_botones, text="Ver proceso Gauss-Jordan", command=self._ver_proceso_gauss, **estilo_btn).grid(row=0, column=1, padx=4)
         tk.Button(fila_botones, text="Limpiar", command=self._limpiar_todo, **estilo_btn).grid(row=0, column=2, padx=4)
 
+        # --- CONSULTA DE GENERADO: w ∈ gen(v1, …, vn) ---
+        fila_generado = tk.Frame(fila_botones, bg=GAUSS_FONDO)
+        fila_generado.grid(row=1, column=0, columnspan=3, sticky="w", pady=(6, 0))
+        tk.Label(fila_generado, text="w (p. ej. 1, 2, 3; 0, 1, 1):", bg=GAUSS_FONDO, fg=GAUSS_TEXTO)\
+            .grid(row=0, column=0, padx=4)
+        self.entry_generado = tk.Entry(fila_generado, width=24, bg=GAUSS_CAJA_BG, fg=GAUSS_CAJA_FG)
+        self.entry_generado.grid(row=0, column=1, padx=4)
+        tk.Button(fila_generado, text="¿Pertenece al generado?", command=self._consultar_generado, **estilo_btn)\
+            .grid(row=0, column=2, padx=4)
+
         # --- RESULTADO / RAZONAMIENTO ---
         marco_resultado = tk.LabelFrame(
             panel_izq,
@@ -214,23 +231,15 @@ class AppIndependenciaLineal(tk.Toplevel):
             self.entradas.append(fila_entradas)
 
     def _leer_vectores(self):
+        """
+        Lee las entradas como valores exactos (Fraction): "2/3", "0.1" o "5" se
+        conservan sin pasar por float; vacío, "-" o texto inválido cuentan como 0.
+        """
         filas = len(self.entradas)
         columnas = len(self.entradas[0])
         vectores = []
         for j in range(columnas):
-            v = []
-            for i in range(filas):
-                texto = self.entradas[i][j].get().strip()
-                try:
-                    if texto == "" or texto == "-":  # vacío o solo signo
-                        valor = 0.0
-                    elif "/" in texto:
-                        valor = float(Fraction(texto))  # fracción
-                    else:
-                        valor = float(texto)  # decimal o entero
-                except Exception:
-                    valor = 0.0
-                v.append(valor)
+            v = [convertir_a_fraccion(self.entradas[i][j].get()) for i in range(filas)]
             vectores.append(v)
         return vectores
 
@@ -245,7 +254,9 @@ class AppIndependenciaLineal(tk.Toplevel):
             messagebox.showwarning("Aviso", "Debe ingresar los componentes de los vectores.")
             return
 
-        resultado = analizar_independencia(vectores)
+        self._sincronizar_base(vectores)
+
+        resultado = analizar_independencia(vectores, base=self._base)
         salida = [
             f"Conclusión: Conjunto {'INDEPENDIENTE' if resultado['independiente'] else 'DEPENDIENTE'}",
             f"Razonamiento: {resultado.get('razonamiento', '')}",
@@ -257,9 +268,38 @@ class AppIndependenciaLineal(tk.Toplevel):
             salida.append("Criterio algebraico → No hay variables libres, solo la solución trivial (c = 0).")
         else:
             salida.append("Criterio algebraico → Hay variables libres, existen combinaciones no triviales (dependencia).")
+            relaciones = [texto_combinacion(info["indice"], info["coeficientes"])
+                          for info in self._info_base if info["dependiente"]]
+            if relaciones:
+                salida.append("Relaciones encontradas: " + "; ".join(relaciones))
+            if "espacio_nulo" in resultado:
+                salida.append("Coeficientes (espacio nulo): " + "; ".join(texto_espacio_nulo(resultado["espacio_nulo"])))
 
         self.texto_resultado.insert("end", "\n".join(salida))
 
+    def _sincronizar_base(self, vectores):
+        """Lleva self._base a 'vectores', conservando el resultado de cada inserción."""
+        nuevos = self._base.sincronizar(vectores)
+        self._info_base = self._info_base[:len(vectores) - len(nuevos)] + nuevos
+
+    def _consultar_generado(self):
+        """Responde, para uno o varios w separados por ';', si w ∈ gen(v1, …, vn) y sus coordenadas."""
+        texto = self.entry_generado.get().strip()
+        if not texto:
+            messagebox.showwarning("Aviso", "Escriba las componentes de w separadas por comas.")
+            return
+        vectores = self._leer_vectores()
+        self._sincronizar_base(vectores)
+        try:
+            consultas = [[convertir_a_fraccion(x) for x in parte.split(",")]
+                         for parte in texto.split(";") if parte.strip()]
+            resultados = consultar_generado(vectores, consultas, base=self._base)
+        except ValueError as e:
+            messagebox.showwarning("Aviso", str(e))
+            return
+        self.texto_resultado.delete("1.0", "end")
+        self.texto_resultado.insert("end", "\n".join(r["texto"] for r in resultados))
+
     def _ver_proceso_gauss(self):
         """Muestra todo el procedimiento algebraico:
         - Combinación lineal y sistema homogéneo
@@ -292,7 +332,7 @@ class AppIndependenciaLineal(tk.Toplevel):
         # MATRIZ INICIAL (A|0)
         # =====================================================
         self.texto_procedimiento.insert("end", "MATRIZ INICIAL (A|0):\n")
-        matriz = [list(map(Fraction, fila)) + [Fraction(0)] for fila in zip(*vectores)]
+        matriz = [list(fila) + [Fraction(0)] for fila in zip(*vectores)]
         self.texto_procedimiento.insert("end", matriz_alineada_con_titulo("", matriz, con_barra=True) + "\n")
 
         # =====================================================
@@ -347,6 +387,11 @@ class AppIndependenciaLineal(tk.Toplevel):
                 "Criterio algebraico → Hay variables libres, existen combinaciones no triviales.\n"
                 "Por tanto, el conjunto de vectores es linealmente dependiente.\n"
             )
+            # La base se lee de la RREF que acaba de mostrarse (no se vuelve a eliminar)
+            base_nula = base_espacio_nulo(resultado["rref"], resultado["columnas_pivote"], len(vectores))
+            self.texto_procedimiento.insert("end", "\nBase de coeficientes de dependencia (espacio nulo):\n")
+            for linea in texto_espacio_nulo(base_nula):
+                self.texto_procedimiento.insert("end", linea + "\n")
 
     def _limpiar_todo(self):
         """Limpia todos los campos y resultados, dejando los Entry vacíos."""
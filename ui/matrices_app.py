@@ -4,8 +4,11 @@ from soporte.validaciones import limpiar_matriz, matriz_esta_vacia
 from core.operaciones_matrices import (
     sumar_con_pasos,
     restar_con_pasos,
-    multiplicar_con_pasos
+    multiplicar_con_pasos,
+    potencia_con_pasos,
+    gram_con_pasos
 )
+from core.expresiones_matriciales import MotorExpresiones
 from PIL import Image, ImageTk
 from ui.estilos import (
     GAUSS_FONDO as MAT_FONDO,
@@ -23,6 +26,9 @@ from soporte import validaciones
 
 class AppMatrices(BaseApp):
 
+    # Máximo de matrices con det/rango guardados a partir de su inversa
+    MAX_CACHE_ELIMINACION = 32
+
     def __init__(self, toplevel_parent=None, on_volver=None):
         super().__init__(toplevel_parent, on_volver, titulo="Operaciones con Matrices")
         self.configure(bg=MAT_FONDO)
@@ -32,6 +38,12 @@ class AppMatrices(BaseApp):
         self.matriz_B = []
         self.resultado = None
 
+        # det(A) y rango(A) obtenidos al calcular inversas, por matriz
+        self._cache_eliminacion = {}
+
+        # Resultados intermedios de expresiones (A·B, (A·B)⁻¹, ...) durante la sesión
+        self._motor_expresiones = MotorExpresiones()
+
         # Tamaños por defecto
         self.filas_A = self.columnas_A = 3
         self.filas_B = self.columnas_B = 3
@@ -100,11 +112,35 @@ class AppMatrices(BaseApp):
             ("A + B", self._op_suma),
             ("A - B", self._op_resta),
             ("A × B", self._op_mult),
+            ("A · Aᵀ", lambda: self._op_gram(False)),
+            ("Aᵀ · A", lambda: self._op_gram(True)),
             ("Limpiar todo", self._limpiar_todo),
         ]
         for i, (txt, cmd) in enumerate(botones_ops):
             tk.Button(fila_ops, text=txt, command=cmd, **estilo_btn).grid(row=i, column=0, pady=4)
 
+        # --- Expresión en cadena (p. ej. A*B*A*B) ---
+        marco_expr = tk.Frame(fila_ops, bg=MAT_FONDO)
+        marco_expr.grid(row=len(botones_ops), column=0, pady=(8, 4))
+        self.entry_expresion = tk.Entry(
+            marco_expr, width=14, bg=MAT_CAJA_BG, fg=MAT_CAJA_FG,
+            justify="center", font=("Segoe UI", 10)
+        )
+        self.entry_expresion.pack(side="left", padx=(0, 6))
+        tk.Button(marco_expr, text="Evaluar", command=self._op_expresion, **estilo_btn)\
+            .pack(side="left")
+
+        # --- Potencia A^k ---
+        marco_pot = tk.Frame(fila_ops, bg=MAT_FONDO)
+        marco_pot.grid(row=len(botones_ops) + 1, column=0, pady=(4, 4))
+        self.entry_exponente = tk.Entry(
+            marco_pot, width=6, bg=MAT_CAJA_BG, fg=MAT_CAJA_FG,
+            justify="center", font=("Segoe UI", 10)
+        )
+        self.entry_exponente.pack(side="left", padx=(0, 6))
+        tk.Button(marco_pot, text="Aᵏ", command=self._op_potencia, **estilo_btn)\
+            .pack(side="left")
+
         # ==== Panel derecho (Procedimiento / Resultado) ====
         panel_der = tk.Frame(raiz, bg=MAT_FONDO)
         panel_der.grid(row=0, column=1, rowspan=1, sticky="nsew", padx=(6, 10), pady=(8, 6))
@@ -446,6 +482,60 @@ class AppMatrices(BaseApp):
             print(f"[ERROR] en _op_mult: {e}")
             self._mostrar_error(f"Ocurrió un error durante la multiplicación: {e}")
             
+    def _op_expresion(self):
+        """Evalúa una expresión sobre A y B (p. ej. 2A·B + A·B − (A·B)⁻¹)."""
+        try:
+            expresion = self.entry_expresion.get().strip()
+            if not expresion:
+                self._mostrar_error("Escribe una expresión, por ejemplo 2A·B + (A·B)⁻¹.")
+                return
+
+            matrices = {}
+            for nombre in ("A", "B"):
+                if nombre in expresion:
+                    if matriz_esta_vacia(self.matriz_A if nombre == "A" else self.matriz_B):
+                        self._mostrar_error(f"La matriz {nombre} está vacía.")
+                        return
+                    matrices[nombre] = self._leer_matriz(nombre)
+
+            resultado = self._motor_expresiones.evaluar(expresion, matrices)
+            self._mostrar_desde_core(resultado)
+
+        except Exception as e:
+            print(f"[ERROR] en _op_expresion: {e}")
+            self._mostrar_error(f"Ocurrió un error al evaluar la expresión: {e}")
+
+    def _op_gram(self, transpuesta_primero):
+        """Calcula la matriz de Gram A·Aᵀ o Aᵀ·A (solo el triángulo superior, luego simetría)."""
+        try:
+            if matriz_esta_vacia(self.matriz_A):
+                self._mostrar_error("La matriz A está vacía.")
+                return
+            resultado = gram_con_pasos(self._leer_matriz("A"), transpuesta_primero)
+            self._mostrar_desde_core(resultado)
+
+        except Exception as e:
+            print(f"[ERROR] en _op_gram: {e}")
+            self._mostrar_error(f"Ocurrió un error al calcular la matriz de Gram: {e}")
+
+    def _op_potencia(self):
+        """Calcula A^k con el exponente indicado (k puede ser negativo)."""
+        try:
+            if matriz_esta_vacia(self.matriz_A):
+                self._mostrar_error("La matriz A está vacía.")
+                return
+            exponente = self.entry_exponente.get().strip()
+            if not exponente:
+                self._mostrar_error("Escribe el exponente k para calcular Aᵏ.")
+                return
+
+            resultado = potencia_con_pasos(self._leer_matriz("A"), exponente)
+            self._mostrar_desde_core(resultado)
+
+        except Exception as e:
+            print(f"[ERROR] en _op_potencia: {e}")
+            self._mostrar_error(f"Ocurrió un error al calcular la potencia: {e}")
+
     def _op_escalar(self, cual):
         """Escala una matriz (A o B) usando el número indicado y muestra el resultado."""
         try:
@@ -516,10 +606,27 @@ class AppMatrices(BaseApp):
             self.texto_res.insert("end", resultado["resultado_frac"])
 
             self.resultado = resultado["resultado_lista"]
+            self._guardar_eliminacion(M, resultado)
         except Exception as e:
             import traceback; print(traceback.format_exc())
             self._mostrar_error(f"Ocurrió un error al calcular la inversa de la matriz {cual}: {type(e).__name__}: {e}")
 
+    @staticmethod
+    def _clave_matriz(M):
+        return tuple(tuple(fila) for fila in M)
+
+    def _guardar_eliminacion(self, M, resultado):
+        """Guarda det/rango que la inversa obtuvo como subproducto de la eliminación."""
+        if any(k not in resultado for k in ("det", "rango", "justificacion_det")):
+            return
+        if len(self._cache_eliminacion) >= self.MAX_CACHE_ELIMINACION:
+            self._cache_eliminacion.pop(next(iter(self._cache_eliminacion)))
+        self._cache_eliminacion[self._clave_matriz(M)] = {
+            "det": resultado["det"],
+            "rango": resultado["rango"],
+            "reporte": resultado["justificacion_det"],
+        }
+
     def _formatear_matriz(self, M):
         """Devuelve una matriz como texto legible para el widget de texto."""
         if not M:
@@ -535,7 +642,10 @@ class AppMatrices(BaseApp):
         from core.determinante_matriz import determinante_cofactores
         try:
             M = self._leer_matriz("A" if cual=="A" else "B")
-            resultado = determinante_cofactores(M, expandir_por="fila", indice=0)
+            # Si ya se calculó la inversa de esta matriz, det(A) sale de esa eliminación
+            resultado = self._cache_eliminacion.get(self._clave_matriz(M))
+            if resultado is None:
+                resultado = determinante_cofactores(M, expandir_por="fila", indice=0)
 
             self.texto_proc.delete("1.0", "end")
             self.texto_proc.insert("end", resultado["reporte"] + "\n")